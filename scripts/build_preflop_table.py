@@ -0,0 +1,64 @@
+# scripts/build_preflop_table.py
+"""
+Build the heads-up preflop equity table used by MonteCarloSimulator.calculate_equity.
+
+Simulates each of the 169 starting hand classes against one random hand
+and writes src/data/preflop_equity.json. Run from the repository root:
+
+    python scripts/build_preflop_table.py [iterations_per_class]
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.poker_engine import card_id
+from src.monte_carlo import MonteCarloSimulator, preflop_class, _PREFLOP_TABLE_PATH, _RANK_CHARS
+
+
+def starting_hands():
+    """
+    One representative pair of hole card IDs per starting hand class.
+    """
+
+    for high in range(14, 1, -1):
+        for low in range(high, 1, -1):
+            # Pairs and offsuit hands use two suits, suited hands one
+            yield np.array([card_id(high, 0), card_id(low, 1)], dtype=np.uint8)
+            if high != low:
+                yield np.array([card_id(high, 0), card_id(low, 0)], dtype=np.uint8)
+
+
+def main(iterations: int) -> None:
+    table = {}
+    start = time.perf_counter()
+    no_community = np.empty(0, dtype=np.uint8)
+
+    for player_ids in starting_hands():
+        wins, ties, losses = MonteCarloSimulator._simulate(player_ids, no_community, 1, iterations)
+        table[preflop_class(player_ids)] = {
+            'win': round(wins / iterations, 4),
+            'tie': round(ties / iterations, 4),
+            'loss': round(losses / iterations, 4)
+        }
+
+    # Order by rank then suitedness so the file diffs cleanly
+    order = {char: i for i, char in enumerate(_RANK_CHARS)}
+    keys = sorted(table, key=lambda k: (-order[k[0]], -order[k[1]], k[2:]))
+
+    os.makedirs(os.path.dirname(_PREFLOP_TABLE_PATH), exist_ok=True)
+    # One hand class per line
+    lines = [f"  {json.dumps(k)}: {json.dumps(table[k])}" for k in keys]
+    with open(_PREFLOP_TABLE_PATH, 'w') as f:
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+    print(f"Wrote {len(table)} hand classes to {_PREFLOP_TABLE_PATH} "
+          f"in {time.perf_counter() - start:.1f}s ({iterations} iterations each)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
@@ -0,0 +1,35 @@
+"""
+Build the optional native extensions in place:
+
+    python setup.py build_ext --inplace
+
+The Cython evaluator and deck are only built when Cython is installed. Everything
+falls back to the pure Python / NumPy code when they are not built.
+"""
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+extra_compile_args = ['-O3']
+
+ext_modules = [
+    Extension('src._eval7_avx2', ['src/eval7_avx2.c'], extra_compile_args=extra_compile_args),
+]
+
+if cythonize is not None:
+    ext_modules += cythonize(
+        [Extension('src._eval', ['src/_eval.pyx'], extra_compile_args=extra_compile_args + ['-march=native']),
+         Extension('src._fastdeck', ['src/_fastdeck.pyx'], extra_compile_args=extra_compile_args)],
+        language_level=3,
+    )
+
+setup(
+    name='poker-equity-analyser',
+    packages=['src'],
+    package_data={'src': ['data/*.json']},
+    ext_modules=ext_modules,
+)
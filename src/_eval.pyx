@@ -0,0 +1,62 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# src/_eval.pyx
+"""
+Cython build of the batched 7-card evaluator.
+
+Same lookup scheme and calling convention as eval7_batch in eval7_avx2.c,
+for installs where the C extension isn't built. hand_evaluator picks it up
+automatically when compiled:
+
+    python setup.py build_ext --inplace
+"""
+
+from libc.stdint cimport uint8_t, int16_t, int64_t
+
+
+cdef inline int16_t eval7(const uint8_t* cards, const int16_t[::1] flush_masks,
+                          const int16_t[::1] noflush7, const int64_t[:, ::1] choose) noexcept nogil:
+    """
+    Strength of one 7-card hand, lower is stronger.
+    """
+
+    cdef unsigned short suit_masks[4]
+    cdef int ranks[7]
+    cdef int i, j, rank
+    cdef int16_t flush = 0
+    cdef Py_ssize_t index = 0
+
+    suit_masks[0] = suit_masks[1] = suit_masks[2] = suit_masks[3] = 0
+    for i in range(7):
+        rank = cards[i] >> 2
+        suit_masks[cards[i] & 3] |= 1 << rank
+
+        # Insertion sort of the ranks
+        j = i
+        while j > 0 and ranks[j - 1] > rank:
+            ranks[j] = ranks[j - 1]
+            j -= 1
+        ranks[j] = rank
+
+    for i in range(4):
+        if flush_masks[suit_masks[i]] > flush:
+            flush = flush_masks[suit_masks[i]]
+    if flush > 0:
+        return flush
+
+    for i in range(7):
+        index += choose[ranks[i] + i, i + 1]
+    return noflush7[index]
+
+
+def eval7_batch(const uint8_t[:, ::1] cards, int16_t[::1] out, size_t n,
+                const int16_t[::1] flush_masks, const int16_t[::1] noflush7, const int64_t[:, ::1] choose):
+    """
+    Evaluate n hands of 7 card IDs (uint8[n, 7]) into int16 out[n].
+
+    flush_masks: int16[8192], noflush7: int16[C(19, 7)], choose: int64[53, 8]
+    """
+
+    cdef size_t h
+    with nogil:
+        for h in range(n):
+            out[h] = eval7(&cards[h, 0], flush_masks, noflush7, choose)
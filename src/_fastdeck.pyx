@@ -0,0 +1,265 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# src/_fastdeck.pyx
+"""
+Cython build of Deck.
+
+CDeck mirrors the Deck API in poker_engine (same methods, same deal
+order and errors) but shuffles its uint8 card buffer in C with its own
+xorshift64* state, so shuffling and dealing run without the GIL.
+poker_engine swaps it in for Deck when compiled (the pure Python class
+stays available as PyDeck):
+
+    python setup.py build_ext --inplace
+"""
+
+import os
+import numpy as np
+from libc.stdint cimport uint8_t, uint64_t
+
+from .poker_engine import _ALL_CARDS, card_ids
+
+
+cdef inline uint64_t _next(uint64_t* state) noexcept nogil:
+    """
+    xorshift64* step, returns the next 64 random bits.
+    """
+
+    cdef uint64_t x = state[0]
+    x ^= x >> 12
+    x ^= x << 25
+    x ^= x >> 27
+    state[0] = x
+    return x * <uint64_t>0x2545F4914F6CDD1D
+
+
+cdef inline int _below(uint64_t* state, int n) noexcept nogil:
+    """
+    Random int in [0, n) from the top 32 bits (multiply-shift, no modulo).
+    """
+
+    return <int>(((_next(state) >> 32) * <uint64_t>n) >> 32)
+
+
+cdef class CDeck:
+    """
+    Standard 52 card deck for poker
+
+    Attributes:
+        cards: uint8 array of card IDs remaining in deck (dealt from the end)
+    """
+
+    cdef object _cards       # uint8[52] array owning the buffer, so views keep it alive
+    cdef uint8_t[::1] _buf
+    cdef int _idx
+    cdef uint64_t _state
+
+    def __init__(self, seed=None):
+        """
+        Initialise a full 52 deck card and shuffle it
+
+        Args:
+            seed (int, optional): Seed for a reproducible deck. Defaults
+                to fresh OS entropy.
+        """
+
+        cdef int i
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+
+        # Spread the seed over all 64 bits; xorshift needs a non-zero state
+        self._state = (<uint64_t>(seed & 0xFFFFFFFFFFFFFFFF) * <uint64_t>0x9E3779B97F4A7C15) | 1
+        self._cards = np.arange(52, dtype=np.uint8)
+        self._buf = self._cards
+        self._idx = 52
+        self.shuffle()
+
+    @property
+    def cards(self):
+        """
+        Card IDs still in the deck, as a view (no copy)
+        """
+
+        return self._cards[:self._idx]
+
+    cdef void _shuffle_top(self, int n) noexcept nogil:
+        """
+        Fisher-Yates over the first n cards.
+        """
+
+        cdef int i, j
+        cdef uint8_t tmp
+        for i in range(n - 1, 0, -1):
+            j = _below(&self._state, i + 1)
+            tmp = self._buf[i]
+            self._buf[i] = self._buf[j]
+            self._buf[j] = tmp
+
+    def reset(self, known=()):
+        """
+        Refill the deck without the known cards and shuffle it
+
+        Args:
+            known: Cards (or an array of card IDs) already in play, e.g. hole and board cards
+
+        Raises:
+            ValueError: if a known card is not a card ID 0-51 or is given twice
+        """
+
+        cdef uint8_t seen[52]
+        cdef int i, n = 0, k
+        cdef long cid
+        known_ids = card_ids(known).tolist()
+        k = len(known_ids)
+
+        for i in range(52):
+            seen[i] = 0
+        for i in range(k):
+            cid = known_ids[i]
+            if cid < 0 or cid > 51:
+                raise ValueError(f"Cannot reset with card ID {cid}, IDs run from 0 to 51")
+            if seen[cid]:
+                raise ValueError(f"Cannot reset with card ID {cid} known twice")
+            seen[cid] = 1
+        for i in range(52):
+            if not seen[i]:
+                self._buf[n] = i
+                n += 1
+
+        # Known cards sit past the top of the deck, as if dealt
+        for i in range(k):
+            self._buf[n + i] = known_ids[i]
+        self._idx = n
+        self.shuffle()
+
+    def shuffle(self):
+        """
+        Shuffles deck randomly
+        """
+
+        with nogil:
+            self._shuffle_top(self._idx)
+
+    def __str__(self):
+        """
+        String representation of deck
+
+        Returns:
+            str: Shows number of cards and first few cards
+        """
+
+        if self._idx == 0:
+            return "Deck(empty)"
+
+        cards_to_show = min(5, self._idx)
+        card_str = ', '.join(str(_ALL_CARDS[self._buf[i]]) for i in range(cards_to_show))
+
+        if self._idx > cards_to_show:
+            return f"Deck ({self._idx} cards): {card_str}, ..."
+        else:
+            return f"Deck ({self._idx} cards): {card_str}"
+
+    def card_objects(self):
+        """
+        Cards remaining in the deck as Card objects
+
+        Returns:
+            list[Card]: Shared Card objects in deck order
+        """
+
+        return [_ALL_CARDS[self._buf[i]] for i in range(self._idx)]
+
+    cdef int _take(self, int k) except -1:
+        """
+        Move the pointer down past k cards, raising if the deck runs short.
+        """
+
+        if k > self._idx:
+            raise ValueError(f"Cannot deal {k}, as only {self._idx} cards in the deck")
+        self._idx -= k
+        return self._idx
+
+    def deal(self):
+        """
+        Deal a single card from the deck
+
+        Returns:
+            Card: The dealt card
+
+        Raises:
+            ValueError: if deck is empty
+        """
+
+        if self._idx == 0:
+            raise ValueError("Cannot deal from an empty deck")
+
+        self._idx -= 1
+        return _ALL_CARDS[self._buf[self._idx]]
+
+    def deal_random(self, int k):
+        """
+        Deal k random cards without shuffling the rest of the deck
+
+        Returns:
+            np.ndarray: uint8 card IDs of the dealt cards, in deal order
+        """
+
+        cdef int i, top, pick
+        cdef uint8_t tmp
+        if k > self._idx:
+            raise ValueError(f"Cannot deal {k}, as only {self._idx} cards in the deck")
+
+        # Partial Fisher-Yates on the top k positions
+        with nogil:
+            for i in range(k):
+                top = self._idx - 1 - i
+                pick = _below(&self._state, top + 1)
+                tmp = self._buf[top]
+                self._buf[top] = self._buf[pick]
+                self._buf[pick] = tmp
+
+        start = self._take(k)
+        return self._cards[start:start + k][::-1].copy()
+
+    def deal_bits(self, int k):
+        """
+        Deal k cards from the deck as a 52-bit card set
+
+        Returns:
+            int: Mask with bit id set for each dealt card (see Card.bit)
+        """
+
+        cdef int i, start = self._take(k)
+        cdef uint64_t mask = 0
+        for i in range(start, start + k):
+            mask |= (<uint64_t>1) << self._buf[i]
+        return mask
+
+    def deal_to_players(self, int num_players, int cards_per_player=2):
+        """
+        Deals cards to players one by one
+
+        Returns:
+            list[list[Card]]: Hands in position order
+        """
+
+        cdef int total_cards_needed = num_players * cards_per_player
+        cdef int top, r, p
+        if total_cards_needed > self._idx:
+            raise ValueError(f"Cannot deal {total_cards_needed}, as only {self._idx} cards in the deck")
+
+        # Round r, player p gets the (r * num_players + p)-th card from the top
+        top = self._idx - 1
+        self._idx -= total_cards_needed
+        return [[_ALL_CARDS[self._buf[top - (r * num_players + p)]] for r in range(cards_per_player)]
+                for p in range(num_players)]
+
+    def deal_community_cards(self, int num_cards):
+        """
+        Deals community cards (flop/turn/river)
+
+        Returns:
+            list[Card]: list of community cards
+        """
+
+        cdef int i, start = self._take(num_cards)
+        return [_ALL_CARDS[self._buf[i]] for i in range(start + num_cards - 1, start - 1, -1)]
@@ -6,8 +6,15 @@ Identifies poker hands and determines winners in Texas Hold'em.
 """
 
 from enum import IntEnum
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from collections import Counter
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import comb
+import ctypes
+import os
+import pickle
+import numpy as np
 from .poker_engine import Card
 
 
@@ -30,16 +37,31 @@ class HandEvaluator:
     Evaluates poker hands and determines winners.
     
     Handles 5, 6, or 7 card hands (Texas Hold'em).
+
+    Cards may be given as Card objects or as a uint8 array of card IDs
+    (see poker_engine.card_id); internally rank = (id >> 2) + 2 and
+    suit = id & 3.
     """
+
+    @staticmethod
+    def _card_ids(cards) -> List[int]:
+        """
+        Convert Card objects or a card ID array to a list of int card IDs.
+        """
+
+        if isinstance(cards, np.ndarray):
+            return cards.tolist()
+
+        return [card.id for card in cards]
     
     @staticmethod
-    def evaluate_hand(cards: List['Card']) -> Tuple[HandRank, List[int]]:
+    def evaluate_hand(cards) -> Tuple[HandRank, List[int]]:
         """
         Evaluate the best 5-card poker hand from given cards.
         
         Parameters:
-        cards : List[Card]
-            5-7 cards to evaluate
+        cards : List[Card] or np.ndarray[uint8]
+            5-7 cards (or card IDs) to evaluate
             
         Returns:
         Tuple[HandRank, List[int]]
@@ -50,22 +72,129 @@ class HandEvaluator:
             Full house KKK22 returns (HandRank.FULL_HOUSE, [13, 2])
             Flush A-K-Q-J-9 returns (HandRank.FLUSH, [14, 13, 12, 11, 9])
         """
+
+        hand_rank, tiebreakers = _HAND_CLASSES[HandEvaluator.hand_strength(cards)]
+        return (hand_rank, list(tiebreakers))
+
+    @staticmethod
+    def hand_strength(cards) -> int:
+        """
+        Strength of the best 5-card hand using the Cactus Kev lookup tables.
         
-        ranks = [int(card.rank) for card in cards]
-        flush_ranks = HandEvaluator._check_flush(cards)
-        straight_high = HandEvaluator._check_straight(ranks)
-        fours, triples, pairs, kickers = HandEvaluator._check_pairs_and_sets(cards)
+        Parameters:
+        cards : List[Card] or np.ndarray[uint8]
+            5-7 cards (or card IDs) to evaluate
+            
+        Returns:
+        int
+            Equivalence class from 1 (royal flush) to 7462 (7-5-4-3-2
+            offsuit); lower is stronger
+        """
+
+        # Sorted so every ordering of the same cards shares a cache entry
+        return _cached_strength(tuple(sorted(HandEvaluator._card_ids(cards))))
+
+    @staticmethod
+    def _strength(ids) -> int:
+        """
+        Uncached hand_strength on a sequence of 5-7 int card IDs.
+        """
+
+        if len(ids) == 5:
+            return _eval5(*[_CK_CARDS[cid] for cid in ids])
+
+        # Per-suit rank bitmasks: with 6-7 cards a flush always beats
+        # anything the remaining cards could make
+        masks = [0, 0, 0, 0]
+        for cid in ids:
+            masks[cid & 3] |= 1 << (cid >> 2)
+        for mask in masks:
+            if _POPCOUNT[mask] >= 5:
+                return _FLUSH_MASKS[mask]
+
+        # Otherwise only the rank multiset matters: colex index of the
+        # sorted ranks (r_i + i are distinct) into the non-flush table
+        index = 0
+        for i, rank in enumerate(sorted(cid >> 2 for cid in ids)):
+            index += _CHOOSE[rank + i][i + 1]
+
+        return _NOFLUSH[len(ids)][index]
+
+    @staticmethod
+    def evaluate_batch(hands: np.ndarray) -> np.ndarray:
+        """
+        Vectorised hand_strength over many hands at once.
+        
+        Parameters:
+        hands : np.ndarray[uint8]
+            Card IDs of shape (..., n) with 5 <= n <= 7, one hand per row
+            
+        Returns:
+        np.ndarray[int16]
+            Strengths of shape (...), lower is stronger
+        """
+
+        hands = np.asarray(hands)
+        num_cards = hands.shape[-1]
+        flat = hands.reshape(-1, num_cards)
+
+        if num_cards == 7 and _NATIVE_EVAL7 is not None:
+            flat = np.ascontiguousarray(flat, dtype=np.uint8)
+            out = np.empty(flat.shape[0], dtype=np.int16)
+            _NATIVE_EVAL7(flat, out, flat.shape[0], _FLUSH_MASKS_ARR, _NOFLUSH_ARR[7], _CHOOSE_ARR)
+            return out.reshape(hands.shape[:-1])
+
+        ranks = (flat >> 2).astype(np.intp)
+        suits = flat & 3
+        rank_bits = np.left_shift(1, ranks)
+
+        # Rank bitmask per suit; ranks within a suit are distinct so sum == OR
+        masks = np.empty((flat.shape[0], 4), dtype=np.intp)
+        for suit in range(4):
+            masks[:, suit] = np.where(suits == suit, rank_bits, 0).sum(axis=1)
+        flush = _FLUSH_MASKS_ARR[masks].max(axis=1)
+
+        positions = np.arange(num_cards)
+        index = _CHOOSE_ARR[np.sort(ranks, axis=1) + positions, positions + 1].sum(axis=1)
+        noflush = _NOFLUSH_ARR[num_cards][index]
+
+        return np.where(flush > 0, flush, noflush).reshape(hands.shape[:-1])
+
+    @staticmethod
+    def _eval_core(ids: List[int]) -> Tuple[HandRank, List[int]]:
+        """
+        Classify cards by checking each hand rank in turn.
+
+        Slow reference path, only used to build the lookup tables at import.
+        _features makes the only pass over the cards; every check below
+        works on the masks and counts it returns.
+        
+        Parameters:
+        ids : List[int]
+            5 card IDs to classify
+            
+        Returns:
+        Tuple[HandRank, List[int]]
+            (hand_rank, tiebreakers)
+        """
+
+        rank_mask, rank_counts, suit_masks = HandEvaluator._features(ids)
+
+        # Flush: the suit holding 5+ ranks
+        flush_mask = HandEvaluator._flush_mask(suit_masks)
+        flush_ranks = HandEvaluator._top5_bits(flush_mask) if flush_mask else None
+
+        straight_high = _mask_straight_high(rank_mask)
+        fours, triples, pairs, kickers = HandEvaluator._group_ranks(rank_counts)
         
-        # Royal flush
-        if flush_ranks and straight_high == 14:
-            # Need to verify it's actually A-K-Q-J-10 of same suit
-            if set(flush_ranks) >= {14, 13, 12, 11, 10}:
-                return (HandRank.ROYAL_FLUSH, [14])
+        # Royal flush: A-K-Q-J-10 all in the flush suit
+        if (flush_mask & _ROYAL) == _ROYAL:
+            return (HandRank.ROYAL_FLUSH, [14])
 
         # Straight flush
         if flush_ranks and straight_high:
             # Check that it actually is a straight flush
-            straight_flush = HandEvaluator._check_straight(flush_ranks)
+            straight_flush = _mask_straight_high(flush_mask)
             if straight_flush:
                 return (HandRank.STRAIGHT_FLUSH, [straight_flush])
         
@@ -99,16 +228,79 @@ class HandEvaluator:
         if pairs:
             return (HandRank.PAIR, pairs + kickers[:3])
 
-        # High card
-        return (HandRank.HIGH_CARD, sorted(ranks, reverse=True)[:5])
-    
+        # High card: every rank is a kicker, already sorted
+        return (HandRank.HIGH_CARD, kickers[:5])
+
+    @staticmethod
+    def _features(ids: List[int]) -> Tuple[int, List[int], List[int]]:
+        """
+        Extract every integer feature the rank checks need in one pass.
+        
+        Parameters:
+        ids : List[int]
+            Card IDs to analyse
+            
+        Returns:
+        Tuple[int, List[int], List[int]]
+            (rank_mask, rank_counts, suit_masks)
+            rank_mask: 13-bit mask of the ranks present (bit 0 = rank 2 ... bit 12 = Ace)
+            rank_counts: count per rank, indexed by rank value (length 15)
+            suit_masks: rank bitmask per suit, same bit layout as rank_mask
+        """
+
+        rank_counts = [0] * 15
+        suit_masks = [0, 0, 0, 0]
+        for cid in ids:
+            rank_index = cid >> 2
+            rank_counts[rank_index + 2] += 1
+            suit_masks[cid & 3] |= 1 << rank_index
+
+        return suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3], rank_counts, suit_masks
+
     @staticmethod
-    def _check_flush(cards: List['Card']) -> Optional[List[int]]:
+    def _flush_mask(suit_masks: List[int]) -> int:
+        """
+        Rank bitmask of the suit holding 5+ cards, or 0 if there is none.
+        """
+
+        for mask in suit_masks:
+            if _POPCOUNT[mask] >= 5:
+                return mask
+
+        return 0
+
+    @staticmethod
+    def _group_ranks(rank_counts: List[int]) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """
+        (fours, threes, pairs, kickers) from per-rank counts, each sorted descending.
+        """
+
+        fours = []
+        triples = []
+        pairs = []
+        kickers = []
+
+        # Walking ranks high to low keeps every list sorted descending
+        for rank in range(14, 1, -1):
+            count = rank_counts[rank]
+            if count == 4:
+                fours.append(rank)
+            elif count == 3:
+                triples.append(rank)
+            elif count == 2:
+                pairs.append(rank)
+            elif count == 1:
+                kickers.append(rank)
+
+        return (fours, triples, pairs, kickers)
+
+    @staticmethod
+    def _check_flush(cards) -> Optional[List[int]]:
         """
         Check if cards contain a flush.
         
         Parameters:
-        cards : List[Card]
+        cards : List[Card] or np.ndarray[uint8]
             Cards to check (need at least 5 of same suit)
             
         Returns:
@@ -116,16 +308,10 @@ class HandEvaluator:
             Ranks of flush cards (highest 5) or None if no flush
         """
 
-        suit_count = Counter(card.suit for card in cards)
-        for suit, count in suit_count.items():
-            if count >= 5:
-                # Get all cards of this suit and return top 5 ranks
-                flush_ranks = [int(card.rank) for card in cards if card.suit == suit]
-                return sorted(flush_ranks, reverse=True)[:5]
-    
-        return None
-                
-    
+        _, _, suit_masks = HandEvaluator._features(HandEvaluator._card_ids(cards))
+        flush_mask = HandEvaluator._flush_mask(suit_masks)
+        return HandEvaluator._top5_bits(flush_mask) if flush_mask else None
+
     @staticmethod
     def _check_straight(ranks: List[int]) -> Optional[int]:
         """
@@ -133,7 +319,7 @@ class HandEvaluator:
         
         Parameters:
         ranks : List[int]
-            Sorted unique ranks
+            Ranks to check (duplicates allowed)
             
         Returns:
         Optional[int]
@@ -142,31 +328,20 @@ class HandEvaluator:
         Note:
             Handle A-2-3-4-5 where Ace is low
         """
-        # Remove duplicates and sort
-        unique_ranks = sorted(set(ranks), reverse=True)
-    
-        # Check that there are enough ranks for a straight
-        if len(unique_ranks) < 5:
-            return None
-        
-        # Check for regular straights (5 consecutive ranks)
-        for i in range(len(unique_ranks) - 4):
-            if unique_ranks[i] - unique_ranks[i+4] == 4:
-                return unique_ranks[i]  # Return highest card in straight
-    
-        # Check for ace-low straight: A-2-3-4-5
-        if set(unique_ranks) >= {14, 2, 3, 4, 5}:  # Ace is 14
-            return 5  # In ace-low straight, 5 is the "high" card
-    
-        return None  # No straight found
-    
+
+        rank_mask = 0
+        for rank in ranks:
+            rank_mask |= 1 << (rank - 2)
+
+        return _mask_straight_high(rank_mask)
+
     @staticmethod
-    def _check_pairs_and_sets(cards: List['Card']) -> Tuple[List[int], List[int], List[int], List[int]]:
+    def _check_pairs_and_sets(cards) -> Tuple[List[int], List[int], List[int], List[int]]:
         """
         Find all pairs, three of a kinds, and four of a kinds.
         
         Parameters:
-        cards : List[Card]
+        cards : List[Card] or np.ndarray[uint8]
             Cards to analyse
             
         Returns:
@@ -174,60 +349,52 @@ class HandEvaluator:
             (fours, threes, pairs, kickers)
             Each list contains ranks sorted descending
         """
-        
-        rank_counts = Counter(card.rank for card in cards)
 
-        fours = []
-        triples = []
-        pairs = []
-        kickers = []
+        _, rank_counts, _ = HandEvaluator._features(HandEvaluator._card_ids(cards))
+        return HandEvaluator._group_ranks(rank_counts)
 
-        for rank, count in rank_counts.items():
-            if count == 4:
-                fours.append(rank)
-            elif count == 3:
-                triples.append(rank)
-            elif count == 2:
-                pairs.append(rank)
-            else:  # count == 1
-                kickers.append(rank)
+    @staticmethod
+    def _top5_bits(mask: int) -> List[int]:
+        """
+        Ranks of the five highest bits of a rank bitmask, descending.
+        """
 
-        return (sorted(fours, reverse=True), 
-            sorted(triples, reverse=True),
-            sorted(pairs, reverse=True),
-            sorted(kickers, reverse=True))
+        # Clear the lowest set bits until five remain
+        while bin(mask).count('1') > 5:
+            mask &= mask - 1
+
+        ranks = []
+        while mask:
+            high = mask.bit_length() - 1
+            ranks.append(high + 2)
+            mask ^= 1 << high
+
+        return ranks
 
     @staticmethod
-    def compare_hands(hand1: Tuple[HandRank, List[int]], 
-                     hand2: Tuple[HandRank, List[int]]) -> int:
+    def compare_hands(hand1: Union[int, Tuple[HandRank, List[int]]],
+                     hand2: Union[int, Tuple[HandRank, List[int]]]) -> int:
         """
         Compare two evaluated hands.
         
         Parameters:
 
-        hand1 : Tuple[HandRank, List[int]]
-            First hand (rank, tiebreakers)
-        hand2 : Tuple[HandRank, List[int]]
-            Second hand (rank, tiebreakers)
+        hand1 : int or Tuple[HandRank, List[int]]
+            First hand, as a hand_strength (lower is stronger) or (rank, tiebreakers)
+        hand2 : int or Tuple[HandRank, List[int]]
+            Second hand, in the same form as hand1
             
         Returns:
         int
             1 if hand1 wins, -1 if hand2 wins, 0 if tie
         """
-        # hand1 wins
-        if hand1[0] > hand2[0]:
-            return 1
-        elif hand1[0] < hand2[0]:
-            return -1
-        
-        # Same hand rank, compare tiebreakers t1 and t2
-        for t1, t2 in zip(hand1[1], hand2[1]):
-            if t1 > t2:
-                return 1
-            elif t1 < t2:
-                return -1
-            
-        return 0
+
+        # (rank, tiebreakers) tuples order lexicographically, higher wins
+        if isinstance(hand1, tuple):
+            return (hand1 > hand2) - (hand1 < hand2)
+
+        # Strengths: a single integer comparison, lower wins
+        return int(hand2 > hand1) - int(hand2 < hand1)
 
     @staticmethod
     def get_best_five_card_hand(cards: List['Card']) -> List['Card']:
@@ -235,168 +402,279 @@ class HandEvaluator:
         Get the best 5-card hand from 5-7 cards.
         
         Parameters:
-        cards : List[Card]
-            5-7 cards to choose from
+        cards : List[Card] or np.ndarray[uint8]
+            5-7 cards (or card IDs) to choose from
             
         Returns:
         List[Card]
             Best 5 cards that make the strongest hand
         """
 
-        hand_rank, tiebreakers = HandEvaluator.evaluate_hand(cards)
-
-        match hand_rank:
-            case HandRank.ROYAL_FLUSH | HandRank.STRAIGHT_FLUSH:
-                # Find flush suit
-                suit_counts = Counter(card.suit for card in cards)
-                flush_suit = None
-                for suit, count in suit_counts.items():
-                    if count >= 5:
-                        flush_suit = suit
-                        break
-                
-                # Get only cards of flush suit
-                flush_cards = [card for card in cards if card.suit == flush_suit]
-                
-                # Now get the straight from these flush cards
-                straight_flush_cards = HandEvaluator._get_straight_cards(flush_cards, tiebreakers[0])
-                return straight_flush_cards
-    
-            case HandRank.FOUR_OF_A_KIND:
-                # Get ranks for four of a kind and kicker
-                quad_rank = tiebreakers[0]
-                kicker_rank = tiebreakers[1]
-                hand = []
-
-                # Get all 4 cards for quad
-                for card in cards:
-                    if card.rank == quad_rank:
-                        hand.append(card)
-                
-                # Get kicker
-                for card in cards:
-                     if card.rank == kicker_rank:
-                        hand.append(card)
-                        break
-                     
-                return hand
-            
-            case HandRank.FULL_HOUSE:
-                # Get ranks for the full house
-                triple_rank = tiebreakers[0]
-                pair_rank = tiebreakers[1]
-                hand = []
-
-                for card in cards:
-                    if card.rank == triple_rank:
-                        hand.append(card)
-                
-                pair_count = 0
-                for card in cards:
-                    if card.rank == pair_rank:
-                        hand.append(card)
-                        pair_count += 1
-
-                        if pair_count == 2:
-                            break
-
-                return hand
-
-            case HandRank.FLUSH:
-                # Find flush suit
-                suit_counts = Counter(card.suit for card in cards)
-                flush_suit = None
-                for suit, count in suit_counts.items():
-                    if count >= 5:
-                        flush_suit = suit
-                        break
-                
-                # Get all of cards of flush suit, sorted by rank
-                flush_cards = [card for card in cards if card.suit == flush_suit]
-                flush_cards = sorted(flush_cards, key=lambda card: card.rank, reverse=True)
-
-                return flush_cards[:5]
-                
-            case HandRank.STRAIGHT:
-                return HandEvaluator._get_straight_cards(cards, tiebreakers[0])
-            
-            case HandRank.THREE_OF_A_KIND:
-                hand = []
-                triple_rank = tiebreakers[0]
-                kickers_ranks = tiebreakers[1:]
-                for card in cards:
-                     if card.rank == triple_rank:
-                         hand.append(card)
-                
-
-                for card in cards:
-                    if card.rank in kickers_ranks:
-                        hand.append(card)
-                    if len(hand) == 5:
-                        break
-            
-                return hand
-            
-            case HandRank.TWO_PAIR:
-                hand = []
-                pair1_rank = tiebreakers[0]
-                pair2_rank = tiebreakers[1]
-                kicker_rank = tiebreakers[2]
-                kicker_count = 0
-
-                for card in cards:
-                    if card.rank == pair1_rank:
-                        hand.append(card)
-                    elif card.rank == pair2_rank:
-                        hand.append(card)
-                    elif card.rank == kicker_rank and kicker_count == 0:
-                        hand.append(card)
-                        kicker_count += 1
-                
-                return hand
-            
-            case HandRank.PAIR:
-                hand = []
-                pair_rank = tiebreakers[0]
-                kickers_rank = tiebreakers[1:]
-
-                for card in cards:
-                    if card.rank == pair_rank:
-                        hand.append(card)
-                    elif card.rank in kickers_rank:
-                        hand.append(card)
-
-                return hand
-            
-            case HandRank.HIGH_CARD:
-                sorted_cards = sorted(cards, key=lambda x: x.rank, reverse=True)
-                return sorted_cards[:5]
+        if isinstance(cards, np.ndarray):
+            cards = [Card.from_int(cid) for cid in cards]
 
-            case _:
-                raise ValueError(f"Unhandled hand rank: {hand_rank}")
+        # The best hand is the 5-card subset with the lowest strength
+        ck = [_CK_CARDS[cid] for cid in HandEvaluator._card_ids(cards)]
+        best = min(combinations(range(len(cards)), 5),
+                   key=lambda picks: _eval5(*[ck[i] for i in picks]))
 
+        return [cards[i] for i in best]
 
-    @staticmethod
-    def _get_straight_cards(cards: List['Card'], high_rank: int) -> List['Card']:
-        """
-        Get the cards that form a straight.
+# Cactus Kev card encoding, indexed by card ID:
+#   bits 16-28 one bit per rank, bits 12-15 suit, bits 8-11 rank index,
+#   bits 0-7 the rank's prime (2, 3, 5, ... 41 for ranks 2..A)
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = (0x1000, 0x2000, 0x4000, 0x8000)
+_CK_CARDS = [(1 << (16 + (cid >> 2))) | _SUIT_BITS[cid & 3] | ((cid >> 2) << 8) | _PRIMES[cid >> 2]
+             for cid in range(52)]
 
-        Returns:
-            List[Card]
-                returns a list of cards that form a straight
-        """
-        
-        if high_rank == 5:  # Wheel straight
-            target_ranks = [14, 2, 3, 4, 5]
+
+def _eval5(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """
+    Look up the strength (1-7462, lower is stronger) of five Cactus Kev encoded cards.
+    """
+
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+
+    # All five share a suit bit
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return _FLUSHES[q]
+
+    # Five distinct ranks: straight or high card
+    strength = _UNIQUE5[q]
+    if strength:
+        return strength
+
+    # Paired hands are identified by their prime product
+    return _PRODUCTS[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+# 13-bit rank masks (bit 0 = rank 2 ... bit 12 = Ace)
+_ROYAL = 0b1111100000000  # A-K-Q-J-10
+_WHEEL = (1 << 12) | (1 << 0) | (1 << 1) | (1 << 2) | (1 << 3)  # A-2-3-4-5
+
+
+def _mask_straight_high(rank_mask: int) -> Optional[int]:
+    """
+    Highest rank of the best straight in a 13-bit rank mask, or None.
+    """
+
+    # Bit i survives only if bits i-4..i are all set
+    runs = rank_mask & (rank_mask << 1) & (rank_mask << 2) & (rank_mask << 3) & (rank_mask << 4)
+    if runs:
+        return runs.bit_length() + 1  # Bit i is rank i+2
+
+    if (rank_mask & _WHEEL) == _WHEEL:
+        return 5
+
+    return None
+
+
+@lru_cache(maxsize=2**16)
+def _cached_strength(ids: Tuple[int, ...]) -> int:
+    """
+    Memoised HandEvaluator._strength, keyed on the sorted card IDs.
+    """
+
+    return HandEvaluator._strength(ids)
+
+
+def _build_five_card_tables() -> Tuple[list, List[int], List[int], dict]:
+    """
+    Build the 5-card lookup tables.
+
+    Every distinct 5-card hand is classified once with the reference
+    evaluator and the 7462 classes are sorted strongest first, so table
+    order agrees exactly with HandEvaluator.compare_hands.
+
+    Returns:
+    Tuple[list, List[int], List[int], dict]
+        (hand_classes, flushes, unique5, products) where hand_classes[s]
+        is the (HandRank, tiebreakers) of strength s
+    """
+
+    classes = []
+    for ranks in combinations(range(13), 5):
+        # Same ranks all in one suit: straight flush or flush
+        ids = [r * 4 for r in ranks]
+        classes.append((HandEvaluator._eval_core(ids), 'flush', sum(1 << r for r in ranks)))
+
+    for ranks in combinations_with_replacement(range(13), 5):
+        if max(Counter(ranks).values()) > 4:
+            continue
+        # Cycle suits so there is never a flush and equal ranks never share a suit
+        ids = [r * 4 + i % 4 for i, r in enumerate(ranks)]
+        if len(set(ranks)) == 5:
+            classes.append((HandEvaluator._eval_core(ids), 'unique', sum(1 << r for r in ranks)))
         else:
-            target_ranks = list(range(high_rank - 4, high_rank + 1))
-        
-        # Now find cards matching these ranks
-        straight_cards = []
-        for rank in target_ranks:
-            for card in cards:
-                if card.rank == rank:
-                    straight_cards.append(card)
-                    break  # Only need one card of each rank
-        
-        return straight_cards
+            product = 1
+            for r in ranks:
+                product *= _PRIMES[r]
+            classes.append((HandEvaluator._eval_core(ids), 'product', product))
+
+    classes.sort(key=lambda entry: entry[0], reverse=True)
+
+    hand_classes = [None]
+    flushes = [0] * 7937
+    unique5 = [0] * 7937
+    products = {}
+    for strength, ((hand_rank, tiebreakers), kind, key) in enumerate(classes, 1):
+        hand_classes.append((hand_rank, tuple(tiebreakers)))
+        if kind == 'flush':
+            flushes[key] = strength
+        elif kind == 'unique':
+            unique5[key] = strength
+        else:
+            products[key] = strength
+
+    return hand_classes, flushes, unique5, products
+
+
+def _build_seven_card_tables(flushes: List[int], unique5: List[int], products: dict) -> Tuple[List[int], dict]:
+    """
+    Build the direct lookup tables for 5 to 7 card hands.
+
+    Parameters:
+    flushes, unique5, products
+        5-card tables from _build_five_card_tables
+
+    Returns:
+    Tuple[List[int], dict]
+        (flush_masks, noflush) where flush_masks[m] is the best strength of
+        a flush suit holding rank bitmask m, and noflush[n][index] the best
+        strength of an n-card rank multiset at its colex index
+    """
+
+    flush_masks = [0] * 8192
+    for mask in range(8192):
+        bits = [1 << r for r in range(13) if mask >> r & 1]
+        if len(bits) >= 5:
+            flush_masks[mask] = min(flushes[sum(sub)] for sub in combinations(bits, 5))
+
+    # Non-flush strength of every 5-card rank multiset
+    five = {}
+    for ranks in combinations_with_replacement(range(13), 5):
+        if len(set(ranks)) == 5:
+            five[ranks] = unique5[sum(1 << r for r in ranks)]
+        elif max(Counter(ranks).values()) <= 4:
+            product = 1
+            for r in ranks:
+                product *= _PRIMES[r]
+            five[ranks] = products[product]
+
+    noflush = {}
+    for num_cards in (5, 6, 7):
+        table = [0] * _CHOOSE[12 + num_cards][num_cards]
+        for ranks in combinations_with_replacement(range(13), num_cards):
+            if max(Counter(ranks).values()) > 4:
+                continue
+            index = sum(_CHOOSE[r + i][i + 1] for i, r in enumerate(ranks))
+            table[index] = min(five[sub] for sub in combinations(ranks, 5))
+        noflush[num_cards] = table
+
+    return flush_masks, noflush
+
+
+def _load_tables() -> tuple:
+    """
+    Load all lookup tables, building and caching them on first use.
+
+    The tables are pickled into __pycache__ next to this module so later
+    imports skip the build.
+
+    Returns:
+    tuple
+        (hand_classes, flushes, unique5, products, flush_masks, noflush)
+    """
+
+    try:
+        with open(_TABLE_CACHE, 'rb') as f:
+            version, tables = pickle.load(f)
+        if version == _TABLE_VERSION:
+            return tables
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    hand_classes, flushes, unique5, products = _build_five_card_tables()
+    flush_masks, noflush = _build_seven_card_tables(flushes, unique5, products)
+    tables = (hand_classes, flushes, unique5, products, flush_masks, noflush)
+
+    try:
+        os.makedirs(os.path.dirname(_TABLE_CACHE), exist_ok=True)
+        with open(_TABLE_CACHE, 'wb') as f:
+            pickle.dump((_TABLE_VERSION, tables), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Read-only install, rebuild next time
+
+    return tables
+
+
+_CHOOSE = [[comb(n, k) for k in range(8)] for n in range(53)]
+_POPCOUNT = [bin(mask).count('1') for mask in range(8192)]
+
+_TABLE_VERSION = 2
+_TABLE_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'hand_tables.pickle')
+
+_HAND_CLASSES, _FLUSHES, _UNIQUE5, _PRODUCTS, _FLUSH_MASKS, _NOFLUSH = _load_tables()
+
+# Array copies of the tables for evaluate_batch
+_CHOOSE_ARR = np.array(_CHOOSE, dtype=np.int64)
+_FLUSH_MASKS_ARR = np.array(_FLUSH_MASKS, dtype=np.int16)
+_NOFLUSH_ARR = {num_cards: np.array(table, dtype=np.int16) for num_cards, table in _NOFLUSH.items()}
+
+
+def _load_avx2_eval7():
+    """
+    eval7_batch from the AVX2 C extension through ctypes, or None if it isn't built.
+    """
+
+    try:
+        from . import _eval7_avx2
+        library = ctypes.CDLL(_eval7_avx2.__file__)
+    except (ImportError, OSError):
+        return None
+
+    function = library.eval7_batch
+    function.restype = None
+    function.argtypes = [
+        np.ctypeslib.ndpointer(np.uint8, ndim=2, flags='C_CONTIGUOUS'),
+        np.ctypeslib.ndpointer(np.int16, ndim=1, flags='C_CONTIGUOUS'),
+        ctypes.c_size_t,
+        np.ctypeslib.ndpointer(np.int16, ndim=1, flags='C_CONTIGUOUS'),
+        np.ctypeslib.ndpointer(np.int16, ndim=1, flags='C_CONTIGUOUS'),
+        np.ctypeslib.ndpointer(np.int64, ndim=2, flags='C_CONTIGUOUS'),
+    ]
+    return function
+
+
+def _load_cython_eval7():
+    """
+    eval7_batch from the Cython extension, or None if it isn't built.
+    """
+
+    try:
+        from ._eval import eval7_batch
+    except ImportError:
+        return None
+
+    return eval7_batch
+
+
+def _load_native_eval7():
+    """
+    Load eval7_batch from the optional native extensions (see setup.py).
+
+    The AVX2 C extension is preferred whenever it loads. The Cython build
+    has the same signature and is selected only when the C extension is
+    missing or ctypes can't load it (e.g. a build with Cython but without
+    the C extension, or an interpreter without ctypes.CDLL support).
+
+    Returns:
+        The eval7_batch function, or None if neither extension is built
+    """
+
+    return _load_avx2_eval7() or _load_cython_eval7()
+
+
+_NATIVE_EVAL7 = _load_native_eval7()
+NATIVE_AVAILABLE = _NATIVE_EVAL7 is not None
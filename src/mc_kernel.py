@@ -0,0 +1,213 @@
+# src/mc_kernel.py
+"""
+Numba compiled Monte Carlo kernel.
+
+Runs the whole simulation loop (dealing, 7-card evaluation, comparison)
+on uint8 card IDs without touching Python objects. Numba is optional:
+without it the functions still run as plain Python, and
+MonteCarloSimulator uses its NumPy batched path instead.
+
+run_mc_parallel splits the iterations into one chunk per Numba thread.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled."""
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+    def get_num_threads():
+        """Stand-in for numba.get_num_threads: run on a single thread."""
+        return 1
+
+
+@njit(cache=True)
+def eval7(hand, flush_masks, noflush7, choose, scratch):
+    """
+    Strength of a 7-card hand, lower is stronger.
+
+    Same algorithm as HandEvaluator.hand_strength: per-suit rank
+    bitmasks for the flush table, otherwise the colex index of the
+    sorted ranks into the non-flush table.
+
+    Parameters:
+    hand : np.ndarray[uint8]
+        7 card IDs
+    flush_masks, noflush7, choose : np.ndarray
+        Lookup tables from hand_evaluator
+    scratch : np.ndarray[int64]
+        Work buffer of length 7 for the sorted ranks
+    """
+
+    m0 = 0
+    m1 = 0
+    m2 = 0
+    m3 = 0
+    for i in range(7):
+        cid = hand[i]
+        rank = cid >> 2
+        suit = cid & 3
+        if suit == 0:
+            m0 |= 1 << rank
+        elif suit == 1:
+            m1 |= 1 << rank
+        elif suit == 2:
+            m2 |= 1 << rank
+        else:
+            m3 |= 1 << rank
+
+        # Insertion sort of the ranks
+        j = i
+        while j > 0 and scratch[j - 1] > rank:
+            scratch[j] = scratch[j - 1]
+            j -= 1
+        scratch[j] = rank
+
+    flush = max(flush_masks[m0], flush_masks[m1], flush_masks[m2], flush_masks[m3])
+    if flush > 0:
+        return flush
+
+    index = 0
+    for i in range(7):
+        index += choose[scratch[i] + i, i + 1]
+    return noflush7[index]
+
+
+@njit(cache=True)
+def deal_k(deck, n, k):
+    """
+    Partial Fisher-Yates: move k random cards of deck[:n] to deck[:k].
+
+    Only the k dealt positions are swapped, so each call costs O(k)
+    and the deck never needs resetting between iterations.
+
+    Parameters:
+    deck : np.ndarray[uint8]
+        Card IDs to deal from, shuffled in place
+    n : int
+        Number of cards in deck to draw from
+    k : int
+        Number of cards to deal
+    """
+
+    for i in range(k):
+        j = np.random.randint(i, n)
+        deck[i], deck[j] = deck[j], deck[i]
+
+
+@njit(cache=True)
+def run_mc(player_ids, board_ids, num_opponents, n_iter, seed, flush_masks, noflush7, choose):
+    """
+    Simulate n_iter random run-outs for the player against num_opponents random hands.
+
+    Parameters:
+    player_ids : np.ndarray[uint8]
+        Player's 2 hole card IDs
+    board_ids : np.ndarray[uint8]
+        Known community card IDs (0-5)
+    num_opponents : int
+        Number of opponents
+    n_iter : int
+        Number of simulations to run
+    seed : int
+        Seed for the kernel's random generator
+    flush_masks, noflush7, choose : np.ndarray
+        Lookup tables from hand_evaluator
+
+    Returns:
+    Tuple[int, int, int]
+        (wins, ties, losses)
+    """
+
+    np.random.seed(seed)
+
+    known = np.zeros(52, np.bool_)
+    for cid in player_ids:
+        known[cid] = True
+    for cid in board_ids:
+        known[cid] = True
+
+    remaining = np.empty(52 - len(player_ids) - len(board_ids), np.uint8)
+    n = 0
+    for cid in range(52):
+        if not known[cid]:
+            remaining[n] = cid
+            n += 1
+
+    num_board = len(board_ids)
+    cards_needed = 5 - num_board
+    opponent_cards = 2 * num_opponents
+    cards_dealt = opponent_cards + cards_needed
+
+    hand = np.empty(7, np.uint8)
+    scratch = np.empty(7, np.int64)
+    for k in range(num_board):
+        hand[2 + k] = board_ids[k]
+
+    wins = 0
+    ties = 0
+    for _ in range(n_iter):
+        # Only the cards actually dealt get shuffled
+        deal_k(remaining, n, cards_dealt)
+
+        # Complete the board after the opponents' hole cards
+        for k in range(cards_needed):
+            hand[2 + num_board + k] = remaining[opponent_cards + k]
+
+        hand[0] = player_ids[0]
+        hand[1] = player_ids[1]
+        player_strength = eval7(hand, flush_masks, noflush7, choose, scratch)
+
+        best_opponent = 0x7FFF
+        for o in range(num_opponents):
+            hand[0] = remaining[2 * o]
+            hand[1] = remaining[2 * o + 1]
+            strength = eval7(hand, flush_masks, noflush7, choose, scratch)
+            if strength < best_opponent:
+                best_opponent = strength
+            if strength < player_strength:
+                break  # Player already lost
+
+        if player_strength < best_opponent:
+            wins += 1
+        elif player_strength == best_opponent:
+            ties += 1
+
+    return wins, ties, n_iter - wins - ties
+
+
+@njit(parallel=True, cache=True)
+def run_mc_parallel(player_ids, board_ids, num_opponents, n_iter, seed, n_chunks, flush_masks, noflush7, choose):
+    """
+    run_mc sharded across Numba's threads.
+
+    Each of n_chunks chunks (normally get_num_threads()) runs the serial
+    kernel with its own seed (seed + chunk) and its own counters, which
+    are summed at the end.
+
+    Returns:
+    Tuple[int, int, int]
+        (wins, ties, losses)
+    """
+
+    n_chunks = max(1, min(n_chunks, n_iter))
+    counts = np.zeros((n_chunks, 3), np.int64)
+    for chunk in prange(n_chunks):
+        chunk_iter = n_iter // n_chunks + (1 if chunk < n_iter % n_chunks else 0)
+        w, t, l = run_mc(player_ids, board_ids, num_opponents, chunk_iter, seed + chunk,
+                         flush_masks, noflush7, choose)
+        counts[chunk, 0] = w
+        counts[chunk, 1] = t
+        counts[chunk, 2] = l
+
+    return counts[:, 0].sum(), counts[:, 1].sum(), counts[:, 2].sum()
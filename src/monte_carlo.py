@@ -5,17 +5,118 @@ Monte Carlo simulation for poker equity calculation.
 Estimates win probability by simulating thousands of random outcomes.
 """
 
-from typing import List, Tuple, Dict, Optional
-import random
+from typing import List, Tuple, Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
 import time
-from .poker_engine import Card, Deck
-from .hand_evaluator import HandEvaluator
+import numpy as np
+from .poker_engine import Card, card_ids, remaining_ids, canonicalize
+from .hand_evaluator import HandEvaluator, NATIVE_AVAILABLE, _CHOOSE_ARR, _FLUSH_MASKS_ARR, _NOFLUSH_ARR
+from . import mc_kernel
+
+
+# Iterations simulated per vectorised batch (bounds temporary array size)
+_BATCH_SIZE = 16384
+
+# Below this many iterations the Numba kernel beats batching into the C evaluator
+_NATIVE_MIN_ITERATIONS = 1024
+
+# Worker threads for the batched paths (NumPy and the native evaluator release the GIL)
+_NUM_WORKERS = os.cpu_count() or 1
+
+# Smallest share of iterations worth handing to its own thread
+_MIN_SHARD_ITERATIONS = 1024
+
+# Heads-up preflop equity of each of the 169 starting hand classes against a
+# random hand, built offline by scripts/build_preflop_table.py
+_PREFLOP_TABLE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'preflop_equity.json')
+_RANK_CHARS = "23456789TJQKA"
+
+
+def _load_preflop_table() -> Dict[str, Dict[str, float]]:
+    """
+    Load the preflop equity table, or an empty one if it hasn't been built.
+    """
+
+    try:
+        with open(_PREFLOP_TABLE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def preflop_class(player_ids: np.ndarray) -> str:
+    """
+    Starting hand class of two hole card IDs, e.g. 'AA', 'AKs' or 'T9o'.
+    """
+
+    # Higher card first with its suit relabelled 0: suited iff the other is suit 0 too
+    high, low = canonicalize(sorted((int(cid) for cid in player_ids), reverse=True))
+    if high >> 2 == low >> 2:
+        return _RANK_CHARS[high >> 2] * 2
+
+    return _RANK_CHARS[high >> 2] + _RANK_CHARS[low >> 2] + ('s' if low & 3 == 0 else 'o')
+
+
+_PREFLOP_TABLE = _load_preflop_table()
 
 
 class MonteCarloSimulator:
     """
     Calculate poker hand equity using Monte Carlo simulation.
     """
+
+    @staticmethod
+    def _draw(rng: np.random.Generator, remaining_cards: np.ndarray, batch: int, num_cards: int) -> np.ndarray:
+        """
+        Draw num_cards random cards without replacement for each of batch iterations.
+
+        remaining_cards is either one deck of card IDs shared by every
+        iteration, or a (batch, n) array with its own deck per iteration
+        (shuffled in place).
+
+        Returns:
+        np.ndarray[uint8]
+            Array of shape (batch, num_cards)
+        """
+
+        # Partial Fisher-Yates on every row at once: only the first
+        # num_cards positions are shuffled
+        if remaining_cards.ndim == 1:
+            deck = np.tile(remaining_cards, (batch, 1))
+        else:
+            deck = remaining_cards
+        rows = np.arange(batch)
+        for i in range(num_cards):
+            j = rng.integers(i, deck.shape[1], size=batch)
+            picked = deck[rows, j]
+            deck[rows, j] = deck[:, i]
+            deck[:, i] = picked
+
+        return deck[:, :num_cards]
+
+    @staticmethod
+    def _run_sharded(simulate: Callable[..., Tuple[int, int, int]], work: list, *args) -> Tuple[int, int, int]:
+        """
+        Split work across worker threads and sum their (wins, ties, losses).
+
+        simulate(shard, *args, seed) is called once per shard; worker i
+        seeds its own generator with seed + i so the streams never overlap.
+        """
+
+        seed = int(np.random.default_rng().integers(2**31))
+        num_shards = max(1, min(_NUM_WORKERS, len(work)))
+        shards = [work[i::num_shards] for i in range(num_shards)]
+
+        if num_shards == 1:
+            return simulate(shards[0], *args, seed)
+
+        with ThreadPoolExecutor(max_workers=num_shards) as executor:
+            results = list(executor.map(lambda i: simulate(shards[i], *args, seed + i), range(num_shards)))
+
+        wins, ties, losses = (sum(counts) for counts in zip(*results))
+        return wins, ties, losses
     
     @staticmethod
     def calculate_equity(
@@ -38,7 +139,8 @@ class MonteCarloSimulator:
         iterations : int, default=10000
             Number of simulations to run
         measure_time : bool, default=False
-            Whether to measure and return execution time
+            Whether to measure and return execution time (always simulates,
+            bypassing the preflop table)
             
         Returns:
         Dict[str, float]
@@ -51,71 +153,22 @@ class MonteCarloSimulator:
         if community_cards is None:
             community_cards = []
         
-        wins = 0
-        ties = 0
-        losses = 0
-        
         # Start timing if requested
         if measure_time:
             start_time = time.perf_counter()
 
-        for _ in range(iterations):
-            # Create fresh deck
-            deck = Deck()
-            
-            # Remove known cards (compare by rank and suit)
-            remaining_cards = []
-            for card in deck.cards:
-                is_known = False
-                for known_card in player_cards + community_cards:
-                    if card.rank == known_card.rank and card.suit == known_card.suit:
-                        is_known = True
-                        break
-                if not is_known:
-                    remaining_cards.append(card)
-            
-            # Shuffle
-            random.shuffle(remaining_cards)
-            
-            # Deal opponent hands
-            opponent_hands = []
-            cards_dealt = 0
-            for i in range(num_opponents):
-                opponent_hand = remaining_cards[cards_dealt:cards_dealt+2]
-                opponent_hands.append(opponent_hand)
-                cards_dealt += 2
-            
-            # Deal remaining community cards
-            cards_needed = 5 - len(community_cards)
-            new_community = remaining_cards[cards_dealt:cards_dealt+cards_needed]
-            full_community = community_cards + new_community
-            
-            # Evaluate all hands
-            player_eval = HandEvaluator.evaluate_hand(player_cards + full_community)
-            
-            # Check against all opponents
-            player_wins = True
-            player_ties = False
-            
-            for opp_hand in opponent_hands:
-                opp_eval = HandEvaluator.evaluate_hand(opp_hand + full_community)
-                result = HandEvaluator.compare_hands(player_eval, opp_eval)
-                
-                if result == -1:  # Player loses
-                    player_wins = False
-                    break
-                elif result == 0:  # Tie
-                    player_ties = True
-                    player_wins = False
-            
-            if player_wins:
-                wins += 1
-            elif player_ties:
-                ties += 1
-            else:
-                losses += 1
-        
-        results = {'win': wins / iterations, 'tie': ties / iterations, 'loss': losses / iterations}
+        # Work on packed card IDs
+        player_ids = card_ids(player_cards)
+        community_ids = card_ids(community_cards)
+
+        # Heads-up preflop equity is a table lookup, unless the caller is
+        # timing the simulation itself
+        hand_class = preflop_class(player_ids)
+        if not measure_time and len(community_ids) == 0 and num_opponents == 1 and hand_class in _PREFLOP_TABLE:
+            results = dict(_PREFLOP_TABLE[hand_class])
+        else:
+            wins, ties, losses = MonteCarloSimulator._simulate(player_ids, community_ids, num_opponents, iterations)
+            results = {'win': wins / iterations, 'tie': ties / iterations, 'loss': losses / iterations}
         
         # Add timing information if requested
         if measure_time:
@@ -127,6 +180,118 @@ class MonteCarloSimulator:
         return results
             
     
+    @staticmethod
+    def _simulate(
+        player_ids: np.ndarray,
+        community_ids: np.ndarray,
+        num_opponents: int,
+        iterations: int
+    ) -> Tuple[int, int, int]:
+        """
+        Run the simulation on the fastest available backend.
+
+        Returns:
+        Tuple[int, int, int]
+            (wins, ties, losses)
+        """
+
+        # Big runs go to the native batched evaluator, then the Numba kernel,
+        # both spread across every core
+        if mc_kernel.NUMBA_AVAILABLE and not (NATIVE_AVAILABLE and iterations > _NATIVE_MIN_ITERATIONS):
+            seed = int(np.random.default_rng().integers(2**31))
+            return mc_kernel.run_mc_parallel(player_ids, community_ids, num_opponents, iterations,
+                                             seed, mc_kernel.get_num_threads(),
+                                             _FLUSH_MASKS_ARR, _NOFLUSH_ARR[7], _CHOOSE_ARR)
+
+        return MonteCarloSimulator._run_sharded(
+            MonteCarloSimulator._simulate_shard, MonteCarloSimulator._shard_sizes(iterations),
+            player_ids, community_ids, num_opponents)
+
+    @staticmethod
+    def _shard_sizes(iterations: int) -> List[int]:
+        """
+        Split iterations into one share per worker thread, each at least
+        _MIN_SHARD_ITERATIONS (the shards batch internally).
+        """
+
+        num_shards = max(1, min(_NUM_WORKERS, iterations // _MIN_SHARD_ITERATIONS))
+        return [iterations // num_shards + (1 if i < iterations % num_shards else 0) for i in range(num_shards)]
+
+    @staticmethod
+    def _batch_sizes(iterations: int) -> List[int]:
+        """
+        Split iterations into batches of at most _BATCH_SIZE.
+        """
+
+        return [min(_BATCH_SIZE, iterations - start) for start in range(0, iterations, _BATCH_SIZE)]
+
+    @staticmethod
+    def _simulate_shard(
+        shard: List[int],
+        player_ids: np.ndarray,
+        community_ids: np.ndarray,
+        num_opponents: int,
+        seed: int
+    ) -> Tuple[int, int, int]:
+        """
+        Worker for _run_sharded: simulate its share of the iterations with its own generator.
+        """
+
+        return MonteCarloSimulator._simulate_batched(
+            player_ids, community_ids, num_opponents, sum(shard), np.random.default_rng(seed))
+
+    @staticmethod
+    def _simulate_batched(
+        player_ids: np.ndarray,
+        community_ids: np.ndarray,
+        num_opponents: int,
+        iterations: int,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[int, int, int]:
+        """
+        Vectorised simulation on (batch, cards) arrays of card IDs.
+
+        Returns:
+        Tuple[int, int, int]
+            (wins, ties, losses)
+        """
+
+        wins = 0
+        ties = 0
+        losses = 0
+
+        remaining_cards = remaining_ids(player_ids, community_ids)
+        cards_needed = 5 - len(community_ids)
+        opponent_cards = 2 * num_opponents
+        if rng is None:
+            rng = np.random.default_rng()
+
+        # Simulate a batch of iterations at a time as (batch, cards) arrays
+        for batch in MonteCarloSimulator._batch_sizes(iterations):
+            draws = MonteCarloSimulator._draw(rng, remaining_cards, batch, opponent_cards + cards_needed)
+
+            # Known community cards followed by the run-out
+            board = np.hstack((np.broadcast_to(community_ids, (batch, len(community_ids))),
+                               draws[:, opponent_cards:]))
+
+            # Evaluate all hands (lower strength is better)
+            player_strength = HandEvaluator.evaluate_batch(
+                np.hstack((np.broadcast_to(player_ids, (batch, 2)), board)))
+
+            # Every opponent in one call as (batch, num_opponents, 7), keep the strongest
+            opponent_hands = np.concatenate(
+                (draws[:, :opponent_cards].reshape(batch, num_opponents, 2),
+                 np.broadcast_to(board[:, None, :], (batch, num_opponents, board.shape[1]))), axis=2)
+            best_opponent = HandEvaluator.evaluate_batch(opponent_hands).min(axis=1)
+
+            batch_wins = int(np.count_nonzero(player_strength < best_opponent))
+            batch_ties = int(np.count_nonzero(player_strength == best_opponent))
+            wins += batch_wins
+            ties += batch_ties
+            losses += batch - batch_wins - batch_ties
+
+        return wins, ties, losses
+    
     @staticmethod
     def calculate_range_equity(
         player_cards: List[Card],
@@ -157,70 +322,25 @@ class MonteCarloSimulator:
 
         if community_cards is None:
             community_cards = []
-        
-        wins = 0
-        ties = 0
-        losses = 0
-        total_iterations = 0
 
         # Start timing if requested
         if measure_time:
             start_time = time.perf_counter()
 
-        for opp_hand in opponent_range:
-            # Check if this opponent hand conflicts with known cards
-            opp_cards = list(opp_hand)  # Convert tuple to list
-            
-            # Skip if cards overlap
-            conflicts = False
-            for opp_card in opp_cards:
-                for known_card in player_cards + community_cards:
-                    if opp_card.rank == known_card.rank and opp_card.suit == known_card.suit:
-                        conflicts = True
-                        break
-                if conflicts:
-                    break
-            
-            if conflicts:
-                continue
-            
-            # Run iterations for this specific opponent hand
-            for _ in range(iterations_per_hand):
-                total_iterations += 1
-                deck = Deck()
-                
-                # Remove all known cards
-                known_cards = player_cards + community_cards + opp_cards
-                remaining_cards = []
-                for card in deck.cards:
-                    is_known = False
-                    for known in known_cards:
-                        if card.rank == known.rank and card.suit == known.suit:
-                            is_known = True
-                            break
-                    if not is_known:
-                        remaining_cards.append(card)
-                
-                random.shuffle(remaining_cards)
-                
-                # Deal remaining community
-                cards_needed = 5 - len(community_cards)
-                new_community = remaining_cards[:cards_needed]
-                full_community = community_cards + new_community
-                
-                # Evaluate
-                player_eval = HandEvaluator.evaluate_hand(player_cards + full_community)
-                opp_eval = HandEvaluator.evaluate_hand(opp_cards + full_community)
-                result = HandEvaluator.compare_hands(player_eval, opp_eval)
-                
-                if result == 1:
-                    wins += 1
-                elif result == 0:
-                    ties += 1
-                else:
-                    losses +=1
-        
+        player_ids = card_ids(player_cards)
+        community_ids = card_ids(community_cards)
+        known_ids = set(player_ids.tolist()) | set(community_ids.tolist())
+
+        # Skip opponent hands that overlap the known cards
+        opponent_hands = [card_ids(list(opp_hand)) for opp_hand in opponent_range]
+        opponent_hands = [opp_ids for opp_ids in opponent_hands if not known_ids.intersection(opp_ids.tolist())]
+
+        # Opponent hands are independent, so each worker takes a share of the range
+        wins, ties, losses = MonteCarloSimulator._run_sharded(
+            MonteCarloSimulator._simulate_range_shard, opponent_hands,
+            player_ids, community_ids, iterations_per_hand)
         total = wins + ties + losses
+        total_iterations = total
 
         if total == 0:
             return {'win': 0.0, 'tie': 0.0, 'loss': 0.0}
@@ -235,4 +355,60 @@ class MonteCarloSimulator:
             results['iterations_per_second'] = total_iterations / elapsed_time if elapsed_time > 0 else 0 
             results['total_iterations'] = total_iterations
 
-        return results
\ No newline at end of file
+        return results
+
+    @staticmethod
+    def _simulate_range_shard(
+        opponent_hands: List[np.ndarray],
+        player_ids: np.ndarray,
+        community_ids: np.ndarray,
+        iterations_per_hand: int,
+        seed: int
+    ) -> Tuple[int, int, int]:
+        """
+        Worker for calculate_range_equity: play the player against each given opponent hand.
+
+        Returns:
+        Tuple[int, int, int]
+            (wins, ties, losses)
+        """
+
+        wins = 0
+        ties = 0
+        losses = 0
+        cards_needed = 5 - len(community_ids)
+        rng = np.random.default_rng(seed)
+
+        # Simulate several opponent hands per batch, one row per (hand, iteration)
+        hands_per_batch = max(1, _BATCH_SIZE // max(1, iterations_per_hand))
+        for first in range(0, len(opponent_hands), hands_per_batch):
+            group = np.array(opponent_hands[first:first + hands_per_batch], dtype=np.uint8)
+
+            # Each opponent hand has its own unseen cards (all the same length)
+            remaining_cards = np.array([remaining_ids(player_ids, community_ids, opp_ids) for opp_ids in group])
+            if len(group) == 1:
+                remaining_cards = remaining_cards[0]
+
+            for batch in MonteCarloSimulator._batch_sizes(iterations_per_hand):
+                rows = len(group) * batch
+                decks = remaining_cards if len(group) == 1 else np.repeat(remaining_cards, batch, axis=0)
+
+                # Player and opponent side by side as (rows, 2, 7) sharing each board,
+                # evaluated in one call
+                hands = np.empty((rows, 2, 7), dtype=np.uint8)
+                hands[:, 0, :2] = player_ids
+                hands[:, 1, :2] = np.repeat(group, batch, axis=0)
+                hands[:, :, 2:2 + len(community_ids)] = community_ids
+                hands[:, :, 2 + len(community_ids):] = MonteCarloSimulator._draw(
+                    rng, decks, rows, cards_needed)[:, None, :]
+                strength = HandEvaluator.evaluate_batch(hands)
+                player_strength = strength[:, 0]
+                opp_strength = strength[:, 1]
+
+                batch_wins = int(np.count_nonzero(player_strength < opp_strength))
+                batch_ties = int(np.count_nonzero(player_strength == opp_strength))
+                wins += batch_wins
+                ties += batch_ties
+                losses += batch * len(group) - batch_wins - batch_ties
+
+        return wins, ties, losses
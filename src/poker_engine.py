@@ -2,11 +2,11 @@
 Core poker components: Card, Deck, and basic logic
 """
 
-from enum import IntEnum
-import random
+from typing import Optional
+import numpy as np
 
-class Rank(IntEnum):
-    """Card ranks from 2 to Ace"""
+class Rank:
+    """Card ranks from 2 to Ace, as plain ints"""
 
     TWO = 2
     THREE = 3
@@ -22,36 +22,78 @@ class Rank(IntEnum):
     KING = 13
     ACE = 14
 
+    _ALL = range(2, 15)
+    _NAMES = ('TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT',
+              'NINE', 'TEN', 'JACK', 'QUEEN', 'KING', 'ACE')
 
-class Suit(IntEnum):
-    """Card suits in poker"""
+
+class Suit:
+    """Card suits in poker, as plain ints"""
 
     HEARTS = 0
     DIAMONDS = 1
     CLUBS = 2
     SPADES = 3
 
+    _ALL = range(4)
+    _NAMES = ('HEARTS', 'DIAMONDS', 'CLUBS', 'SPADES')
+
+
+# Lookup tables from packed card IDs to symbols
+_RANK_SYMBOLS = "23456789TJQKA"
+_SUIT_SYMBOLS = "♥♦♣♠"
+
+# str() and repr() of every card, indexed by card ID
+_STR_TABLE = tuple(_RANK_SYMBOLS[i >> 2] + _SUIT_SYMBOLS[i & 3] for i in range(52))
+_REPR_TABLE = tuple(f"Card(Rank.{Rank._NAMES[i >> 2]}, Suit.{Suit._NAMES[i & 3]})" for i in range(52))
+
 
 class Card():
     """
     Represents a single playing card
     
+    Stored as one packed card ID, (rank - 2) * 4 + suit, see card_id()
+
     Attributes:
-        rank: Rank enum value (2-14)
-        suit: Suit enum value (0-3)
+        rank: Rank value (2-14)
+        suit: Suit value (0-3)
+        id: Packed card ID (0-51)
+        bit: 1 << id, for 52-bit card set masks
     """
 
+    # No per-instance __dict__: smaller Cards and faster attribute access
+    __slots__ = ('_v',)
+
     def __init__(self, rank: Rank, suit: Suit) -> None:
         """
         Initialise a card with rank and suit
         
         Args:
-            rank: Rank enum (e.g., Rank.ACE)
-            suit: Suit enum (e.g., Suit.SPADES)
+            rank: Rank value (e.g., Rank.ACE)
+            suit: Suit value (e.g., Suit.SPADES)
         """
 
-        self.rank = rank
-        self.suit = suit
+        self._v = (int(rank) - 2) * 4 + int(suit)
+
+    @property
+    def rank(self) -> int:
+        """Rank value (2-14)"""
+        return (self._v >> 2) + 2
+
+    @property
+    def suit(self) -> int:
+        """Suit value (0-3)"""
+        return self._v & 3
+
+    @property
+    def id(self) -> int:
+        """Packed card ID (0-51)"""
+        return self._v
+
+    @property
+    def bit(self) -> int:
+        """Single-bit mask of the card in a 52-bit card set (1 << id)"""
+        return 1 << self._v
 
     def __repr__(self):
         """
@@ -60,7 +102,7 @@ class Card():
         Returns:
             str: String literal of Card object
         """
-        return f"Card(Rank.{self.rank.name}, Suit.{self.suit.name})"
+        return _REPR_TABLE[self._v]
 
     def __str__(self) -> str:
         """
@@ -69,12 +111,8 @@ class Card():
         Returns:
             String like "A♠" or "K♥" or "7♣"    
         """
-        rank_symbols = "23456789TJQKA"
-        suit_symbols = "♥♦♣♠"
 
-        rank_char = rank_symbols[self.rank - 2]
-        suit_char = suit_symbols[self.suit]
-        return f"{rank_char}{suit_char}"
+        return _STR_TABLE[self._v]
 
     def __eq__(self, other: 'Card') -> bool:
         """
@@ -87,7 +125,7 @@ class Card():
             bool: True if same rank AND suit
         """
         
-        return self.rank == other.rank and self.suit == other.suit
+        return self._v == other._v
         
     def __lt__(self, other: 'Card') -> bool:
         """
@@ -101,31 +139,219 @@ class Card():
 
         """
 
-        return self.rank < other.rank
-      
+        return (self._v >> 2) < (other._v >> 2)
+
+    def __hash__(self) -> int:
+        """
+        Hash of the card, its packed card ID
+
+        Returns:
+            int: Card ID in 0-51
+        """
+
+        return self._v
+
+    @classmethod
+    def from_int(cls, cid: int) -> 'Card':
+        """
+        Build a Card from its packed card ID
+
+        Args:
+            cid (int): Card ID in 0-51, see card_id()
+
+        Returns:
+            Card: The matching Card object
+        """
+
+        card = cls.__new__(cls)
+        card._v = int(cid)
+        return card
+
+
+def card_id(rank: int, suit: int) -> int:
+    """
+    Pack a rank and suit into a single card ID
+
+    Rank lives in the high bits and suit in the low two bits, so
+    rank = (cid >> 2) + 2 and suit = cid & 3.
+
+    Args:
+        rank (int): Rank value (2-14)
+        suit (int): Suit value (0-3)
+
+    Returns:
+        int: Card ID in 0-51
+    """
+
+    return (int(rank) - 2) * 4 + int(suit)
+
+
+def card_ids(cards) -> np.ndarray:
+    """
+    Convert cards to a uint8 array of card IDs
+
+    Args:
+        cards: Sequence of Card objects, or an array of card IDs
+
+    Returns:
+        np.ndarray: uint8 card IDs in the same order
+    """
+
+    if isinstance(cards, np.ndarray):
+        return cards.astype(np.uint8, copy=False)
+
+    return np.fromiter((card.id for card in cards),
+                       dtype=np.uint8, count=len(cards))
+
+
+
+def canonicalize(ids) -> tuple:
+    """
+    Relabel suits in order of first appearance
+
+    The first suit seen becomes suit 0, the next new suit 1, and so on.
+    Suits are interchangeable in poker, so isomorphic card sets (e.g.
+    AhKh and AsKs) map to the same IDs with the same hand strength.
+
+    Args:
+        ids: Sequence of card IDs
+
+    Returns:
+        tuple: Card IDs with relabelled suits, in the same order
+    """
+
+    relabel = [-1, -1, -1, -1]
+    next_suit = 0
+    canonical = []
+    for cid in ids:
+        suit = cid & 3
+        if relabel[suit] < 0:
+            relabel[suit] = next_suit
+            next_suit += 1
+        canonical.append((cid & ~3) | relabel[suit])
+
+    return tuple(canonical)
+
+
+# Encoded 52-card deck, built once and copied from
+_FULL_DECK = np.arange(52, dtype=np.uint8)
+_FULL_DECK.setflags(write=False)
+
+# The 52 cards, built once and indexed by card ID; Decks only ever hand
+# out these shared Cards, so dealing never allocates
+_ALL_CARDS = tuple(Card.from_int(i) for i in range(52))
+_ALL_CARD_SET = frozenset(_ALL_CARDS)
+
+
+def remaining_ids(*known_ids: np.ndarray) -> np.ndarray:
+    """
+    Card IDs of every card not in the given ID arrays
+
+    Args:
+        *known_ids (np.ndarray): Arrays of card IDs already in use
+
+    Returns:
+        np.ndarray: uint8 IDs of the unseen cards, ascending
+    """
+
+    mask = np.ones(52, dtype=bool)
+    for ids in known_ids:
+        mask[ids] = False
+
+    return _FULL_DECK[mask]
+
+
+def unseen_cards(*known) -> frozenset:
+    """
+    Every Card not among the known cards
+
+    Card object counterpart of remaining_ids: Cards hash by their card
+    ID, so excluding them is one frozenset difference.
+
+    Args:
+        *known: Iterables of Cards already in use (hole cards, board, ...)
+
+    Returns:
+        frozenset: The unseen Cards
+    """
+
+    return _ALL_CARD_SET.difference(*known)
+
+
+# Shared generator (PCG64) for every unseeded Deck
+_RNG = np.random.default_rng()
+
 
 class Deck:
     """
     Standard 52 card deck for poker
 
     Attributes:
-        cards: List of Card objects remaining in deck
+        cards: uint8 array of card IDs remaining in deck (dealt from the end)
     """
 
-    def __init__(self) -> None:
+    # Full deck of card IDs, copied by every new Deck
+    _BASE = _FULL_DECK
+
+    __slots__ = ('_cards', '_rng', '_idx')
+
+    def __init__(self, seed: Optional[int] = None) -> None:
         """
         Initialise a full 52 deck card and shuffle it
+
+        Args:
+            seed (int, optional): Seed for a private generator, giving a
+                reproducible deck. Defaults to the shared generator.
         """
         
-        self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        self._cards = self._BASE.copy()
+        self._rng = _RNG if seed is None else np.random.default_rng(seed)
+        self._idx = len(self._cards)  # Cards at or past _idx have been dealt
         self.shuffle()
+
+    @property
+    def cards(self) -> np.ndarray:
+        """
+        Card IDs still in the deck, as a view (no copy)
+        """
+
+        return self._cards[:self._idx]
     
+    def reset(self, known=()) -> None:
+        """
+        Refill the deck without the known cards and shuffle it
+
+        Reuses the deck's buffer, so one Deck can serve many simulations.
+        The known cards are parked past the top of the deck as if
+        already dealt, and only the unknown cards are shuffled.
+
+        Args:
+            known: Cards (or an array of card IDs) already in play, e.g. hole and board cards
+
+        Raises:
+            ValueError: if a known card is not a card ID 0-51 or is given twice
+        """
+
+        known_ids = card_ids(known)
+        try:
+            unknown = remaining_ids(known_ids)
+        except IndexError:
+            raise ValueError(f"Cannot reset with card ID {known_ids.max()}, IDs run from 0 to 51") from None
+
+        if len(unknown) + len(known_ids) != 52:
+            raise ValueError(f"Cannot reset with card ID {np.bincount(known_ids).argmax()} known twice")
+
+        self._idx = len(unknown)
+        self._cards[:self._idx] = unknown
+        self._cards[self._idx:] = known_ids
+        self.shuffle()
+
     def shuffle(self) -> None:
         """
         Shuffles deck randomly
         """
     
-        random.shuffle(self.cards)
+        self._rng.shuffle(self.cards)
     
     def __str__(self):
         """
@@ -135,17 +361,26 @@ class Deck:
             str: Shows number of cards and first few cards
         """
 
-        if not self.cards:
+        if len(self.cards) == 0:
             return "Deck(empty)"
         
         cards_to_show = min(5, len(self.cards))
-        card_str = ', '.join(str(card) for card in self.cards[:cards_to_show])
+        card_str = ', '.join(str(_ALL_CARDS[cid]) for cid in self.cards[:cards_to_show])
 
         if len(self.cards) > cards_to_show:
             return f"Deck ({len(self.cards)} cards): {card_str}, ..."
         else:
             return f"Deck ({len(self.cards)} cards): {card_str}"
 
+    def card_objects(self) -> list[Card]:
+        """
+        Cards remaining in the deck as Card objects
+
+        Returns:
+            list[Card]: Shared Card objects in deck order
+        """
+
+        return [_ALL_CARDS[cid] for cid in self.cards]
 
     def deal(self) -> Card:
         """
@@ -158,10 +393,58 @@ class Deck:
             ValueError: if deck is empty
         """
 
-        if not self.cards:
+        if self._idx == 0:
             raise ValueError("Cannot deal from an empty deck")
         
-        return self.cards.pop()
+        self._idx -= 1
+        return _ALL_CARDS[self._cards[self._idx]]
+
+    def deal_random(self, k: int) -> np.ndarray:
+        """
+        Deal k random cards from the undealt cards, as card IDs
+
+        The undealt cards are reshuffled and the top k dealt. NumPy's C
+        shuffle of at most 52 cards is faster than an O(k) partial
+        Fisher-Yates driven from Python.
+
+        Args:
+            k (int): Number of cards to deal
+
+        Returns:
+            np.ndarray: uint8 card IDs of the dealt cards, in deal order
+
+        Raises:
+            ValueError: if the deck has fewer than k cards
+        """
+
+        if k > self._idx:
+            raise ValueError(f"Cannot deal {k}, as only {self._idx} cards in the deck")
+
+        self._rng.shuffle(self.cards)
+        self._idx -= k
+        return self._cards[self._idx:self._idx + k][::-1].copy()
+
+    def deal_bits(self, k: int) -> int:
+        """
+        Deal k cards from the deck as a 52-bit card set
+
+        Args:
+            k (int): Number of cards to deal
+
+        Returns:
+            int: Mask with bit id set for each dealt card (see Card.bit)
+
+        Raises:
+            ValueError: if the deck has fewer than k cards
+        """
+
+        if k > self._idx:
+            raise ValueError(f"Cannot deal {k}, as only {self._idx} cards in the deck")
+
+        self._idx -= k
+
+        # Bits are distinct, so summing them is OR-ing them
+        return sum(1 << cid for cid in self._cards[self._idx:self._idx + k].tolist())
 
     def deal_to_players(self, num_players: int, cards_per_player: int = 2) -> list[list[Card]]:
         """
@@ -179,13 +462,13 @@ class Deck:
         if total_cards_needed > len(self.cards):
             raise ValueError(f"Cannot deal {total_cards_needed}, as only {len(self.cards)} cards in the deck")
         
-        hands = [[] for player in range(num_players)]
-        
-        for _ in range(cards_per_player):
-            for player in range(num_players):
-                hands[player].append(self.deal())
+        # Cards in deal order from the top of the deck; round r, player p is
+        # card r * num_players + p, so a (rounds, players) reshape transposes to hands
+        top = self._cards[self._idx - total_cards_needed:self._idx][::-1]
+        self._idx -= total_cards_needed
+        hands = top.reshape(cards_per_player, num_players).T
 
-        return hands
+        return [[_ALL_CARDS[cid] for cid in hand] for hand in hands.tolist()]
 
     def deal_community_cards(self, num_cards: int) -> list[Card]:
         """
@@ -196,8 +479,18 @@ class Deck:
 
         Returns:
             list[Card]: list of community cards
+
+        Raises:
+            ValueError: if the deck has fewer than num_cards cards
         """
-        return [self.deal() for _ in range(num_cards)]
+
+        if num_cards > self._idx:
+            raise ValueError(f"Cannot deal {num_cards}, as only {self._idx} cards in the deck")
+
+        # Slice the top cards off in deal order instead of dealing one at a time
+        top = self._cards[self._idx - num_cards:self._idx][::-1]
+        self._idx -= num_cards
+        return [_ALL_CARDS[cid] for cid in top.tolist()]
 
 
 def display_hands(hands: list[list[Card]]) -> None:
@@ -208,6 +501,14 @@ def display_hands(hands: list[list[Card]]) -> None:
         hands (list[list[Card]]): List of player hands
     """
 
-    for i, hand in enumerate(hands, 1):
-        hand_str = ', '.join(str(card) for card in hand)
-        print(f"Player {i}: [{hand_str}]")
+    # One string for every player, printed in a single call
+    print("\n".join(f"Player {i}: [{', '.join(map(str, hand))}]" for i, hand in enumerate(hands, 1)))
+
+
+# Compiled Deck (src/_fastdeck.pyx) when built, same API with nogil shuffling;
+# the pure Python class stays importable as PyDeck
+PyDeck = Deck
+try:
+    from ._fastdeck import CDeck as Deck
+except ImportError:
+    pass
@@ -4,9 +4,100 @@ Poker strategy calculations: pot odds, EV, and decision making.
 Provides mathematical framework for optimal poker decisions.
 """
 
-from typing import Dict, Optional, Any
+from typing import Optional, NamedTuple, Dict, Tuple
+import atexit
+import multiprocessing
+import multiprocessing.pool
+import os
+import numpy as np
 from .monte_carlo import MonteCarloSimulator
-from .poker_engine import Card
+from .hand_evaluator import NATIVE_AVAILABLE
+from .poker_engine import Card, card_ids
+from . import mc_kernel
+
+
+# get_decision actions: check (nothing to call), call (+EV), fold (-EV)
+_ACTIONS = ('check', 'call', 'fold')
+
+# Process pool for big simulations on the pure NumPy backend, created on first use.
+# The Numba and native backends already use every core on their own.
+_POOL = None
+_POOL_MIN_ITERATIONS = 200_000
+
+
+def _get_pool() -> multiprocessing.pool.Pool:
+    """
+    The shared process pool, started the first time it's needed.
+
+    Workers are spawned rather than forked: forking after Numba or the
+    thread pools in monte_carlo have started threads can deadlock the child.
+    """
+
+    global _POOL
+    if _POOL is None:
+        _POOL = multiprocessing.get_context('spawn').Pool(os.cpu_count())
+        atexit.register(_POOL.terminate)
+
+    return _POOL
+
+
+def _simulate_chunk(
+    player_ids: np.ndarray,
+    community_ids: np.ndarray,
+    num_opponents: int,
+    iterations: int,
+    seed: int
+) -> Tuple[int, int, int]:
+    """
+    Pool worker: one chunk of the NumPy batched simulation on a single thread.
+    """
+
+    return MonteCarloSimulator._simulate_batched(
+        player_ids, community_ids, num_opponents, iterations, np.random.default_rng(seed))
+
+
+def _equity(
+    player_cards: list[Card],
+    community_cards: Optional[list[Card]],
+    num_opponents: int,
+    iterations: int
+) -> Dict[str, float]:
+    """
+    calculate_equity, split across the process pool when it's worth it.
+
+    Workers run _simulate_batched directly (not calculate_equity, which
+    would start a thread pool in every process); worker i seeds its
+    generator with seed + i so the samples are independent.
+    """
+
+    num_workers = os.cpu_count() or 1
+    preflop_heads_up = not community_cards and num_opponents == 1  # Table lookup, nothing to split
+    if (num_workers == 1 or preflop_heads_up or iterations < _POOL_MIN_ITERATIONS
+            or mc_kernel.NUMBA_AVAILABLE or NATIVE_AVAILABLE):
+        return MonteCarloSimulator.calculate_equity(player_cards, community_cards, num_opponents, iterations)
+
+    player_ids = card_ids(player_cards)
+    community_ids = card_ids(community_cards or [])
+    seed = int(np.random.default_rng().integers(2**31))
+    chunks = [iterations // num_workers + (1 if i < iterations % num_workers else 0) for i in range(num_workers)]
+    results = _get_pool().starmap(
+        _simulate_chunk,
+        [(player_ids, community_ids, num_opponents, chunk, seed + i) for i, chunk in enumerate(chunks)])
+
+    wins, ties, losses = (sum(counts) for counts in zip(*results))
+    return {'win': wins / iterations, 'tie': ties / iterations, 'loss': losses / iterations}
+
+
+class Decision(NamedTuple):
+    """
+    Recommended action with the numbers behind it.
+    """
+
+    action: str              # 'call', 'fold', or 'check'
+    equity: Optional[float]  # Win probability, ties counted as half (None when checking)
+    pot_odds: float          # Equity needed to break even
+    ev: float                # Expected value of calling
+    profitable: bool         # ev > 0
 
 
 class StrategyCalculator:
@@ -71,8 +162,37 @@ class StrategyCalculator:
     @staticmethod
     def calculate_breakeven_equity(pot_size: float, call_amount: float) -> float:
         """Calculate minimum equity needed to break even (equals pot odds)."""
-        return StrategyCalculator.calculate_pot_odds(pot_size, call_amount)
+        return call_amount / (pot_size + call_amount)
     
+    @staticmethod
+    def evaluate(
+        player_cards: list[Card],
+        community_cards: Optional[list[Card]],
+        pot_size: float,
+        call_amount: float,
+        num_opponents: int = 1,
+        iterations: int = 10000
+    ) -> Decision:
+        """
+        Equity, pot odds, EV and action in one pass.
+
+        Same inputs and result as get_decision.
+        """
+
+        # Nothing to call: always check, no simulation needed
+        if call_amount == 0:
+            return Decision('check', None, 0.0, 0.0, True)
+
+        MC_results = _equity(player_cards, community_cards, num_opponents, iterations)
+        equity = MC_results['win'] + (MC_results['tie'] / 2)
+
+        # Pot odds and EV inline, sharing the total pot
+        total_pot = pot_size + call_amount
+        pot_odds = call_amount / total_pot
+        ev = equity * total_pot - call_amount
+
+        return Decision(_ACTIONS[1 if ev > 0 else 2], equity, pot_odds, ev, ev > 0)
+
     @staticmethod
     def get_decision(
         player_cards: list[Card],
@@ -81,7 +201,7 @@ class StrategyCalculator:
         call_amount: float,
         num_opponents: int = 1,
         iterations: int = 10000
-    ) -> Dict[str, Any]:
+    ) -> Decision:
         """
         Get recommended action based on equity vs pot odds.
         
@@ -100,33 +220,17 @@ class StrategyCalculator:
             Monte Carlo iterations
             
         Returns:
-        Dict containing:
-            - 'action': 'call', 'fold', or 'check'
-            - 'equity': calculated win probability
-            - 'pot_odds': required equity to break even
-            - 'ev': expected value
-            - 'profitable': boolean
+        Decision with fields:
+            - action: 'call', 'fold', or 'check'
+            - equity: calculated win probability (None when checking)
+            - pot_odds: required equity to break even
+            - ev: expected value
+            - profitable: boolean
             
         Example:
-            {'action': 'call', 'equity': 0.55, 'pot_odds': 0.20, 
-             'ev': 57.50, 'profitable': True}
+            Decision(action='call', equity=0.55, pot_odds=0.20,
+                     ev=57.50, profitable=True)
         """
        
-        MC_results = MonteCarloSimulator.calculate_equity(player_cards, community_cards, num_opponents, iterations)
-        equity = MC_results['win'] + (MC_results['tie'] / 2)
-        pot_odds = StrategyCalculator.calculate_pot_odds(pot_size, call_amount)
-        ev = StrategyCalculator.calculate_ev(equity, pot_size, call_amount)
-       
-        if call_amount == 0:
-            action = 'check'
-        elif ev > 0:
-            action = 'call'
-        else:
-            action = 'fold'
-       
-        return{'action': action,
-                'equity': equity,
-                'pot_odds': pot_odds,
-                'ev': ev,
-                'profitable' : ev > 0
-        }
\ No newline at end of file
+        return StrategyCalculator.evaluate(
+            player_cards, community_cards, pot_size, call_amount, num_opponents, iterations)
@@ -5,13 +5,27 @@ Basic tests for poker engine functionality.
 
 import sys
 import os
+import gc
+import numpy as np
+import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.poker_engine import Card, Deck, Rank, Suit
-from src.hand_evaluator import HandEvaluator, HandRank
-from src.monte_carlo import MonteCarloSimulator
+from src.poker_engine import Card, Deck, PyDeck, Rank, Suit, card_ids, canonicalize, unseen_cards
+from src.hand_evaluator import HandEvaluator, HandRank, _CHOOSE_ARR, _FLUSH_MASKS_ARR, _NOFLUSH_ARR
+from src import hand_evaluator
+from src.monte_carlo import MonteCarloSimulator, preflop_class
+from src import mc_kernel, monte_carlo
+from src import strategy
 from src.strategy import StrategyCalculator
 
+try:
+    from src._fastdeck import CDeck
+except ImportError:
+    CDeck = None
+
+# Run the deck tests on the pure Python Deck and, when built, the Cython one
+DECK_CLASSES = [PyDeck] + ([CDeck] if CDeck is not None else [])
+
 
 def test_card_creation():
     """Test card creation and display."""
@@ -21,14 +35,20 @@ def test_card_creation():
     print(f"Repr: {repr(ace_spades)}")
     assert ace_spades.rank == Rank.ACE
     assert ace_spades.suit == Suit.SPADES
+    assert str(ace_spades) == "A♠"
+    assert Card.from_int(ace_spades.id) == ace_spades
+    assert len({ace_spades, Card.from_int(51)}) == 1
+    assert not hasattr(ace_spades, '__dict__')  # Slotted, no per-instance dict
     print("Card creation works")
 
 
-def test_deck_dealing():
+@pytest.mark.parametrize('Deck', DECK_CLASSES)
+def test_deck_dealing(Deck):
     """Test deck functionality."""
-    print("\n=== Testing Deck ===")
+    print(f"\n=== Testing Deck ({Deck.__name__}) ===")
     deck = Deck()
     print(f"Deck size: {len(deck.cards)}")
+    assert not hasattr(deck, '__dict__')
     
     hands = deck.deal_to_players(2, 2)
     # Pretty print the hands
@@ -37,6 +57,37 @@ def test_deck_dealing():
         print(f"Player {i}: {hand_str}")
     
     assert len(deck.cards) == 48
+    remaining = deck.card_objects()
+    assert len(remaining) == 48
+    assert not any(card in remaining for hand in hands for card in hand)
+    assert unseen_cards(*hands) == frozenset(remaining)
+
+    # Seeded decks are reproducible
+    assert str(Deck(seed=7).deal_to_players(3)) == str(Deck(seed=7).deal_to_players(3))
+
+    drawn = deck.deal_random(7)
+    assert len(set(drawn.tolist())) == 7 and len(deck.cards) == 41
+    assert not set(drawn.tolist()) & set(deck.cards.tolist())
+
+    top = deck.card_objects()[-5:]
+    mask = deck.deal_bits(5)
+    assert mask == sum(card.bit for card in top) and bin(mask).count('1') == 5
+    assert len(deck.cards) == 36
+
+    # Reset refills the deck without the known cards
+    known = hands[0]
+    deck.reset(known)
+    assert len(deck.cards) == 50 and not set(card_ids(known).tolist()) & set(deck.cards.tolist())
+    for bad in ([known[0], known[0]], np.array([60], dtype=np.uint8)):
+        with pytest.raises(ValueError, match="Cannot reset"):
+            deck.reset(bad)
+
+    # The cards view stays valid after its deck is freed
+    cards = Deck(seed=1).cards
+    expected = cards.copy()
+    gc.collect()
+    decks = [Deck() for _ in range(100)]
+    assert (cards == expected).all()
     print("Deck dealing works")
 
 
@@ -75,6 +126,95 @@ def test_hand_evaluation():
     print("Pair detected")
 
 
+def test_seven_card_evaluation():
+    """Test that 7-card hands use the best 5 cards, including kickers."""
+    print("\n=== Testing 7-Card Evaluation ===")
+
+    # Quads with a pair on board: kicker is the pair rank
+    quads = [
+        Card(Rank.ACE, Suit.SPADES),
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.ACE, Suit.CLUBS),
+        Card(Rank.ACE, Suit.DIAMONDS),
+        Card(Rank.KING, Suit.SPADES),
+        Card(Rank.KING, Suit.HEARTS),
+        Card(Rank.QUEEN, Suit.CLUBS)
+    ]
+
+    result = HandEvaluator.evaluate_hand(quads)
+    print(f"Quads evaluation: {result}")
+    assert result == (HandRank.FOUR_OF_A_KIND, [14, 13])
+
+    # Three pairs: best kicker can come from the third pair
+    three_pair = [
+        Card(Rank.ACE, Suit.SPADES),
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.KING, Suit.CLUBS),
+        Card(Rank.KING, Suit.DIAMONDS),
+        Card(Rank.QUEEN, Suit.SPADES),
+        Card(Rank.QUEEN, Suit.HEARTS),
+        Card(Rank.TWO, Suit.CLUBS)
+    ]
+
+    result = HandEvaluator.evaluate_hand(three_pair)
+    print(f"Three pair evaluation: {result}")
+    assert result == (HandRank.TWO_PAIR, [14, 13, 12])
+
+    # Stronger hands have lower strength
+    assert HandEvaluator.hand_strength(quads) < HandEvaluator.hand_strength(three_pair)
+    assert HandEvaluator.compare_hands(HandEvaluator.hand_strength(quads),
+                                       HandEvaluator.hand_strength(three_pair)) == 1
+    assert HandEvaluator.compare_hands(HandEvaluator.evaluate_hand(three_pair),
+                                       HandEvaluator.evaluate_hand(quads)) == -1
+    batch = HandEvaluator.evaluate_batch(card_ids(quads + three_pair).reshape(2, 7))
+    assert HandEvaluator.compare_hands(batch[0], batch[1]) == 1
+    assert HandEvaluator.compare_hands(batch[1], batch[0]) == -1
+    assert HandEvaluator.compare_hands(batch[0], batch[0]) == 0
+
+    # Relabelling suits keeps the strength
+    hearts = card_ids([Card(Rank.ACE, Suit.HEARTS), Card(Rank.KING, Suit.HEARTS)]).tolist()
+    spades = card_ids([Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.SPADES)]).tolist()
+    assert canonicalize(hearts) == canonicalize(spades)
+    assert HandEvaluator.hand_strength(quads) == HandEvaluator.hand_strength(
+        [Card(card.rank, 3 - card.suit) for card in quads])
+
+    # The old per-check helpers still work on cards and ranks
+    assert HandEvaluator._check_pairs_and_sets(three_pair) == ([], [], [14, 13, 12], [2])
+    assert HandEvaluator._check_flush(three_pair) is None
+    spade_flush = [Card(rank, Suit.SPADES) for rank in (14, 13, 9, 7, 3, 2)]
+    assert HandEvaluator._check_flush(spade_flush) == [14, 13, 9, 7, 3]
+    assert HandEvaluator._check_straight([14, 2, 3, 4, 5, 5]) == 5
+    assert HandEvaluator._check_straight([10, 11, 12, 13, 14, 9]) == 14
+    assert HandEvaluator._check_straight([2, 3, 4, 5, 7]) is None
+
+    best_five = HandEvaluator.get_best_five_card_hand(quads)
+    print(f"Best five: {', '.join(str(card) for card in best_five)}")
+    assert sorted(card.rank for card in best_five) == [13, 14, 14, 14, 14]
+    print("7-card evaluation works")
+
+
+def test_evaluator_backends(monkeypatch):
+    """Test every built 7-card batch backend matches the NumPy fallback."""
+    print("\n=== Testing Evaluator Backends ===")
+
+    rng = np.random.default_rng(42)
+    hands = np.argsort(rng.random((50000, 52)), axis=1)[:, :7].astype(np.uint8)
+
+    monkeypatch.setattr(hand_evaluator, '_NATIVE_EVAL7', None)
+    expected = HandEvaluator.evaluate_batch(hands)
+    assert all(expected[i] == HandEvaluator.hand_strength(hands[i]) for i in range(200))
+
+    backends = {'avx2': hand_evaluator._load_avx2_eval7(), 'cython': hand_evaluator._load_cython_eval7()}
+    for name, eval7_batch in backends.items():
+        if eval7_batch is None:
+            print(f"{name}: not built")
+            continue
+        monkeypatch.setattr(hand_evaluator, '_NATIVE_EVAL7', eval7_batch)
+        assert (HandEvaluator.evaluate_batch(hands) == expected).all()
+        print(f"{name}: matches NumPy on {len(hands)} hands")
+    print("Evaluator backends agree")
+
+
 def test_monte_carlo():
     """Test Monte Carlo simulation."""
     print("\n=== Testing Monte Carlo ===")
@@ -85,21 +225,81 @@ def test_monte_carlo():
         Card(Rank.ACE, Suit.HEARTS)
     ]
     
-    print("Running 10,000 simulations for AA vs 1 opponent...")
+    # A flop is on the board, so this simulates instead of using the preflop table
+    flop = [
+        Card(Rank.KING, Suit.DIAMONDS),
+        Card(Rank.SEVEN, Suit.CLUBS),
+        Card(Rank.TWO, Suit.HEARTS)
+    ]
+
+    print("Running 10,000 simulations for AA on K-7-2 vs 1 opponent...")
     results = MonteCarloSimulator.calculate_equity(
         pocket_aces, 
-        community_cards=None,
+        community_cards=flop,
         num_opponents=1,
         iterations=10000
     )
     
     print(f"Results: Win={results['win']:.2%}, Tie={results['tie']:.2%}, Loss={results['loss']:.2%}")
     
-    # AA should win ~85% vs random hand
-    assert results['win'] > 0.75  # Should be around 0.85
+    # AA on a dry flop should win ~90% vs random hand
+    assert results['win'] > 0.75  # Should be around 0.9
     print("Monte Carlo simulation works")
 
 
+def test_monte_carlo_backends(monkeypatch):
+    """Test the compiled kernel and the NumPy batched path agree."""
+    print("\n=== Testing Monte Carlo Backends ===")
+
+    player_ids = card_ids([Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS)])
+    board_ids = card_ids([Card(Rank.KING, Suit.SPADES), Card(Rank.QUEEN, Suit.SPADES), Card(Rank.TWO, Suit.HEARTS)])
+
+    batched = MonteCarloSimulator._simulate_batched(player_ids, board_ids, 2, 20000)
+    kernel = mc_kernel.run_mc(player_ids, board_ids, 2, 20000, 1234,
+                              _FLUSH_MASKS_ARR, _NOFLUSH_ARR[7], _CHOOSE_ARR)
+    sharded = mc_kernel.run_mc_parallel(player_ids, board_ids, 2, 20000, 1234, 4,
+                                        _FLUSH_MASKS_ARR, _NOFLUSH_ARR[7], _CHOOSE_ARR)
+    print(f"Batched (w, t, l): {batched}")
+    print(f"Kernel  (w, t, l): {kernel} (numba: {mc_kernel.NUMBA_AVAILABLE})")
+    print(f"Sharded (w, t, l): {sharded}")
+
+    assert sum(batched) == sum(kernel) == sum(sharded) == 20000
+    # AA on K-Q-2 vs 2 opponents wins ~77%
+    assert abs(batched[0] - kernel[0]) / 20000 < 0.03
+    assert abs(sharded[0] - kernel[0]) / 20000 < 0.03
+
+    # The batched path gives every worker thread a share of the iterations
+    monkeypatch.setattr(monte_carlo, '_NUM_WORKERS', 4)
+    shards = MonteCarloSimulator._shard_sizes(10000)
+    assert len(shards) == 4 and sum(shards) == 10000
+    assert MonteCarloSimulator._shard_sizes(500) == [500]
+    print("Monte Carlo backends agree")
+
+
+def test_preflop_table():
+    """Test heads-up preflop equity comes from the precomputed table."""
+    print("\n=== Testing Preflop Table ===")
+
+    suited = card_ids([Card(Rank.KING, Suit.HEARTS), Card(Rank.ACE, Suit.HEARTS)])
+    offsuit = card_ids([Card(Rank.SEVEN, Suit.CLUBS), Card(Rank.TWO, Suit.SPADES)])
+    pair = card_ids([Card(Rank.TEN, Suit.CLUBS), Card(Rank.TEN, Suit.SPADES)])
+    assert [preflop_class(suited), preflop_class(offsuit), preflop_class(pair)] == ['AKs', '72o', 'TT']
+
+    pocket_aces = [Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS)]
+    table = MonteCarloSimulator.calculate_equity(pocket_aces, num_opponents=1)
+    simulated = MonteCarloSimulator._simulate(card_ids(pocket_aces), card_ids([]), 1, 20000)
+    print(f"Table: {table}")
+    print(f"Simulated (w, t, l): {simulated}")
+
+    assert abs(sum(table.values()) - 1) < 0.001
+    assert abs(table['win'] - simulated[0] / 20000) < 0.02
+
+    # Timing measures a real simulation, never the table lookup
+    timed = MonteCarloSimulator.calculate_equity(pocket_aces, num_opponents=1, iterations=2000, measure_time=True)
+    assert timed['win'] != table['win'] or timed['tie'] != table['tie']
+    print("Preflop table works")
+
+
 def test_monte_carlo_with_timing():
     """Test Monte Carlo simulation with performance measurement."""
     print("\n=== Testing Monte Carlo with Timing ===")
@@ -190,9 +390,9 @@ def test_strategy_calculator():
         iterations=1000  # Fewer iterations for faster test
     )
     
-    print(f"AA decision: {decision['action']} (equity: {decision['equity']:.2%}, EV: ${decision['ev']:.2f})")
-    assert decision['action'] == 'call'
-    assert decision['profitable']
+    print(f"AA decision: {decision.action} (equity: {decision.equity:.2%}, EV: ${decision.ev:.2f})")
+    assert decision.action == 'call'
+    assert decision.profitable
     print("Strong hand correctly calls")
     
     # Test get_decision - weak hand should fold
@@ -209,9 +409,9 @@ def test_strategy_calculator():
         iterations=1000
     )
     
-    print(f"27o decision: {decision['action']} (equity: {decision['equity']:.2%}, EV: ${decision['ev']:.2f})")
-    assert decision['action'] == 'fold'
-    assert not decision['profitable']
+    print(f"27o decision: {decision.action} (equity: {decision.equity:.2%}, EV: ${decision.ev:.2f})")
+    assert decision.action == 'fold'
+    assert not decision.profitable
     print("Weak hand correctly folds")
     
     # Test get_decision - check when free
@@ -223,10 +423,45 @@ def test_strategy_calculator():
         iterations=1000
     )
     
-    print(f"Check decision: {decision['action']} (no bet to call)")
-    assert decision['action'] == 'check'
+    print(f"Check decision: {decision.action} (no bet to call)")
+    assert decision.action == 'check'
+    assert decision.equity is None and decision.ev == 0.0 and decision.profitable
     print("Correctly checks when free")
 
+    # Fused evaluate returns the same decision as a NamedTuple
+    evaluation = StrategyCalculator.evaluate(pocket_aces, None, pot_size=100, call_amount=25, iterations=1000)
+    print(f"Evaluate: {evaluation}")
+    assert evaluation.action == 'call' and evaluation.profitable
+    assert abs(evaluation.pot_odds - 0.20) < 1e-9
+    print("Fused evaluate works")
+
+
+def test_strategy_process_pool(monkeypatch):
+    """Test big NumPy-only simulations are split across the process pool."""
+    print("\n=== Testing Strategy Process Pool ===")
+
+    pocket_aces = [Card(Rank.ACE, Suit.SPADES), Card(Rank.ACE, Suit.HEARTS)]
+    flop = [Card(Rank.KING, Suit.SPADES), Card(Rank.QUEEN, Suit.SPADES), Card(Rank.TWO, Suit.HEARTS)]
+
+    # Force the pool path: pretend only the NumPy backend exists, on 2 CPUs
+    monkeypatch.setattr(mc_kernel, 'NUMBA_AVAILABLE', False)
+    monkeypatch.setattr(strategy, 'NATIVE_AVAILABLE', False)
+    monkeypatch.setattr(strategy, '_POOL_MIN_ITERATIONS', 0)
+    monkeypatch.setattr(strategy, '_POOL', None)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+    try:
+        pooled = strategy._equity(pocket_aces, flop, 2, 20000)
+        assert strategy._POOL is not None
+    finally:
+        if strategy._POOL is not None:
+            strategy._POOL.terminate()
+
+    print(f"Pooled: {pooled}")
+    assert abs(sum(pooled.values()) - 1) < 1e-9
+    # AA on K-Q-2 vs 2 opponents wins ~77%
+    assert abs(pooled['win'] - 0.77) < 0.04
+    print("Process pool works")
+
 
 def run_all_tests():
     """Run all tests."""
@@ -235,11 +470,20 @@ def run_all_tests():
     print("=" * 50)
     
     test_card_creation()
-    test_deck_dealing()
+    for deck_class in DECK_CLASSES:
+        test_deck_dealing(deck_class)
     test_hand_evaluation()
+    test_seven_card_evaluation()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        test_evaluator_backends(monkeypatch)
     test_monte_carlo()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        test_monte_carlo_backends(monkeypatch)
+    test_preflop_table()
     test_monte_carlo_with_timing()
     test_strategy_calculator()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        test_strategy_process_pool(monkeypatch)
     
     print("\n" + "=" * 50)
     print("ALL TESTS PASSED!")